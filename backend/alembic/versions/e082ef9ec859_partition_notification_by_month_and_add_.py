@@ -0,0 +1,117 @@
+"""partition notification by month and add archive
+
+Revision ID: e082ef9ec859
+Revises: 8e2368bbd4af
+Create Date: 2026-10-17 06:32:39.407409
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e082ef9ec859'
+down_revision: Union[str, Sequence[str], None] = '8e2368bbd4af'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns shared by the partitioned table, the plain table it replaces and the archive
+COLUMNS = "id, recipient_id, message, type, is_read, created_at"
+
+
+def create_month_partitions(start, months):
+    """Monthly partitions notification_YYYY_MM from the month containing `start`."""
+    for offset in range(months):
+        year, month = divmod(start.month - 1 + offset, 12)
+        lower = start.replace(year=start.year + year, month=month + 1, day=1)
+        year, month = divmod(lower.month, 12)
+        upper = lower.replace(year=lower.year + year, month=month + 1)
+        op.execute(
+            f"CREATE TABLE notification_{lower:%Y_%m} PARTITION OF notification "
+            f"FOR VALUES FROM ('{lower:%Y-%m-%d}+00') TO ('{upper:%Y-%m-%d}+00')"
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.rename_table('notification', 'notification_unpartitioned')
+    op.execute("ALTER TABLE notification_unpartitioned RENAME CONSTRAINT notification_pkey TO notification_unpartitioned_pkey")
+    op.execute("ALTER INDEX ix_notification_id RENAME TO ix_notification_unpartitioned_id")
+    op.execute("ALTER INDEX ix_notification_recipient_created_at_id RENAME TO ix_notification_unpartitioned_recipient_created_at_id")
+    op.execute("ALTER INDEX ix_notification_recipient_unread RENAME TO ix_notification_unpartitioned_recipient_unread")
+    op.execute("ALTER TABLE notification_unpartitioned RENAME CONSTRAINT notification_recipient_id_fkey TO notification_unpartitioned_recipient_id_fkey")
+
+    # The partition key has to be part of the primary key
+    op.create_table('notification',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('notification_id_seq'::regclass)"), nullable=False),
+    sa.Column('recipient_id', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('type', sa.String(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['recipient_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id', 'created_at'),
+    postgresql_partition_by='RANGE (created_at)'
+    )
+    op.execute("ALTER SEQUENCE notification_id_seq OWNED BY notification.id")
+    op.create_index(op.f('ix_notification_id'), 'notification', ['id'], unique=False)
+    op.create_index('ix_notification_recipient_created_at_id', 'notification', ['recipient_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notification_recipient_unread', 'notification', ['recipient_id'], unique=False, postgresql_where=sa.text('NOT is_read'))
+
+    # Existing months up to two months ahead; anything outside lands in the default partition
+    # until the maintenance command creates its month
+    conn = op.get_bind()
+    start = conn.execute(sa.text(
+        "SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC') FROM notification_unpartitioned"
+    )).scalar()
+    current = conn.execute(sa.text("SELECT date_trunc('month', now() AT TIME ZONE 'UTC')")).scalar()
+    months = (current.year - start.year) * 12 + current.month - start.month
+    create_month_partitions(start, months + 3)
+    op.execute("CREATE TABLE notification_default PARTITION OF notification DEFAULT")
+
+    op.execute(
+        f"INSERT INTO notification ({COLUMNS}) "
+        f"SELECT {COLUMNS.replace('created_at', 'coalesce(created_at, now())')} FROM notification_unpartitioned"
+    )
+    op.drop_table('notification_unpartitioned')
+
+    op.create_table('notification_archive',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('recipient_id', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('type', sa.String(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('archived_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'created_at')
+    )
+    op.create_index('ix_notification_archive_recipient_created_at', 'notification_archive', ['recipient_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notification_archive_recipient_created_at', table_name='notification_archive')
+    op.drop_table('notification_archive')
+
+    op.create_table('notification_unpartitioned',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('notification_id_seq'::regclass)"), nullable=False),
+    sa.Column('recipient_id', sa.Integer(), nullable=False),
+    sa.Column('message', sa.Text(), nullable=False),
+    sa.Column('type', sa.String(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['recipient_id'], ['users.id'], name='notification_recipient_id_fkey_new'),
+    sa.PrimaryKeyConstraint('id', name='notification_pkey_new')
+    )
+    op.execute(f"INSERT INTO notification_unpartitioned ({COLUMNS}) SELECT {COLUMNS} FROM notification")
+    op.execute("ALTER SEQUENCE notification_id_seq OWNED BY notification_unpartitioned.id")
+    op.drop_table('notification') # drops the partitions with it
+    op.rename_table('notification_unpartitioned', 'notification')
+    op.execute("ALTER TABLE notification RENAME CONSTRAINT notification_pkey_new TO notification_pkey")
+    op.execute("ALTER TABLE notification RENAME CONSTRAINT notification_recipient_id_fkey_new TO notification_recipient_id_fkey")
+    op.create_index(op.f('ix_notification_id'), 'notification', ['id'], unique=False)
+    op.create_index('ix_notification_recipient_created_at_id', 'notification', ['recipient_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notification_recipient_unread', 'notification', ['recipient_id'], unique=False, postgresql_where=sa.text('NOT is_read'))
@@ -1,63 +1,30 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
+from datetime import datetime, timezone
 from typing import List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from app.api import deps
 from app.models.user import User, UserRole
-from app.models.job import Job
+from app.models.job import Job, JobStatus
 from app.models.application import Application, ApplicationStatus
 from app.schemas import application as application_schemas
-from pdfminer.high_level import extract_text
-from pathlib import Path
+from app.services.applied_jobs import record_application
+from app.services.ats import score_application
+from app.services.cv_text import get_cv_text
+from app.services.job_cache import job_list_cache
+from app.services.outbox import add_event
+from app.services.ranking import rank_applications
+from app.services.unread_counts import record_notifications
+from app.utils.etag import BOOT_ID, check_etag, make_etag
 
 router = APIRouter()
 
-UPLOAD_DIR = Path("uploads")
-
-def calculate_ats_score(job_description: str, job_requirements: str, cv_path: Path) -> float:
-    """
-    Real ATS Scoring Logic using PDFMiner.
-    1. Extract text from PDF.
-    2. Extract keywords from Job Requirements (simple split).
-    3. Calculate match percentage.
-    """
-    try:
-        # Extract text from CV
-        if not cv_path.exists():
-            print(f"CV Path not found: {cv_path}")
-            return 0.0
-            
-        cv_text = extract_text(cv_path).lower()
-        
-        # Prepare keywords from Requirements (simple approach: split by commas/spaces)
-        # In a real app, use NLP (spacy/nltk) to extract nouns/skills
-        keywords = [k.strip().lower() for k in job_requirements.replace(",", " ").split() if len(k) > 2]
-        keywords += [k.strip().lower() for k in job_description.replace(",", " ").split() if len(k) > 4] # Add some long words from desc
-        
-        if not keywords:
-            return 50.0 # Default if no keywords found
-
-        unique_keywords = set(keywords)
-        matched_count = 0
-        for keyword in unique_keywords:
-            if keyword in cv_text:
-                matched_count += 1
-        
-        score = (matched_count / len(unique_keywords)) * 100
-        
-        # Boost score slightly if description words found, clamp to 100
-        return round(min(score * 1.2, 100.0), 1)
-
-    except Exception as e:
-        print(f"ATS Calculation Error: {e}")
-        return 0.0
-
 @router.post("/{job_id}/apply", response_model=application_schemas.Application)
 def apply_for_job(
     *,
     db: Session = Depends(deps.get_db),
     job_id: int,
     current_user: User = Depends(deps.get_current_active_user),
-    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Apply for a job (Student only).
@@ -80,6 +47,10 @@ def apply_for_job(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    # The deadline sweeper closes expired jobs once a minute; don't accept applications in between
+    if job.status != JobStatus.OPEN or (job.deadline and job.deadline <= datetime.now(timezone.utc)):
+        raise HTTPException(status_code=400, detail="This job is no longer accepting applications")
+
     # Check if already applied
     existing_application = db.query(Application).filter(
         Application.job_id == job_id,
@@ -88,33 +59,32 @@ def apply_for_job(
     if existing_application:
         raise HTTPException(status_code=400, detail="You have already applied for this job")
 
-    # Calculate ATS Score
-    cv_full_path = UPLOAD_DIR / current_user.cv_filename
-    ats_score = calculate_ats_score(job.description, job.requirements, cv_full_path)
+    # Calculate ATS Score from the text extracted when the CV was uploaded
+    cv_text = get_cv_text(db, current_user)
+    ats_score, ats_status = score_application(job, cv_text)
 
     application = Application(
         job_id=job_id,
         student_id=current_user.id,
         cv_snapshot_path=current_user.cv_filename,
         ats_score=ats_score,
+        ats_status=ats_status.value,
         status=ApplicationStatus.APPLIED
     )
     db.add(application)
+    db.flush()
+    
+    # Notify the job's admin through WebSockets (outbox, same transaction)
+    add_event(db, "application_submitted", {
+        "job_id": job_id,
+        "job_title": job.title,
+        "admin_id": job.admin_id,
+        "student_name": current_user.full_name,
+        "application_id": application.id
+    })
     db.commit()
     db.refresh(application)
-    
-    # Broadcast to Admin through WebSockets
-    from app.core.manager import manager
-    msg = {
-        "event": "application_submitted",
-        "data": {
-            "job_id": job_id,
-            "job_title": job.title,
-            "student_name": current_user.full_name,
-            "application_id": application.id
-        }
-    }
-    background_tasks.add_task(manager.broadcast, msg)
+    record_application(current_user.id, job_id)
     
     return application
 
@@ -132,11 +102,12 @@ def list_applications_admin(
     """
     List all applications (Admin only).
     Optional: Filter by job_id.
+    sort_by: date_desc (default), date_asc, score_desc, relevance (requires job_id).
     """
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
     
-    query = db.query(Application).join(Job).options(joinedload(Application.student), joinedload(Application.job))
+    query = db.query(Application).join(Job)
     
     # Restrict to jobs posted by this admin
     query = query.filter(Job.admin_id == current_user.id)
@@ -149,6 +120,13 @@ def list_applications_admin(
         
     if min_score is not None:
         query = query.filter(Application.ats_score >= min_score)
+
+    if sort_by == "relevance": # BM25 over applicants' CV text, within one job
+        if not job_id:
+            raise HTTPException(status_code=400, detail="sort_by=relevance requires a job_id")
+        return rank_applications(db, query, job_id, skip, limit)
+
+    query = query.options(joinedload(Application.student), joinedload(Application.job))
         
     if sort_by == "score_desc":
         query = query.order_by(Application.ats_score.desc())
@@ -162,12 +140,26 @@ def list_applications_admin(
 
 @router.get("/my-applications", response_model=List[application_schemas.Application])
 def list_my_applications(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     List my applications (Student).
+    Supports If-None-Match: 304 when no application (or embedded job) changed since the client's ETag.
     """
+    count, last_update = (
+        db.query(func.count(Application.id), func.max(Application.updated_at))
+        .filter(Application.student_id == current_user.id)
+        .one()
+    )
+    # Applications embed their job, so job edits (jobs version) change the ETag too
+    etag = make_etag("my-applications", current_user.id, count, last_update, BOOT_ID, job_list_cache.version)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+
     applications = db.query(Application).options(joinedload(Application.job)).filter(Application.student_id == current_user.id).all()
     return applications
 
@@ -178,7 +170,6 @@ def update_application_status(
     application_id: int,
     status_update: application_schemas.ApplicationUpdate,
     current_user: User = Depends(deps.get_current_active_user),
-    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Update application status (Admin only).
@@ -219,23 +210,20 @@ def update_application_status(
         type=notification_type
     )
     db.add(notification)
+    add_event(db, "unread_count_changed", {"user_ids": [application.student_id]})
+    
+    # Notify the student (WebSocket and email) through the outbox, same transaction
+    add_event(db, "status_updated", {
+        "application_id": application.id,
+        "status": application.status,
+        "job_id": application.job_id,
+        "job_title": application.job.title,
+        "admin_id": application.job.admin_id,
+        "student_id": application.student_id
+    })
     
     db.commit()
     db.refresh(application)
-    
-    # Broadcast through WebSockets
-    from app.core.manager import manager
-    from fastapi.encoders import jsonable_encoder
-    
-    msg = {
-        "event": "status_updated",
-        "data": {
-            "application_id": application.id,
-            "status": application.status,
-            "job_id": application.job_id,
-            "student_id": application.student_id
-        }
-    }
-    background_tasks.add_task(manager.broadcast, msg)
+    record_notifications(application.student_id)
     
     return application
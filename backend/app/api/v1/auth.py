@@ -10,6 +10,7 @@ from app.core.config import settings
 from app.models.user import User
 from app.schemas import user as user_schemas
 from app.schemas import token as token_schemas
+from app.services.notifications import start_read_cursor
 
 router = APIRouter()
 
@@ -80,6 +81,8 @@ def register_user(
         is_active=user_in.is_active,
     )
     db.add(user)
+    db.flush()
+    start_read_cursor(db, user)
     db.commit()
     db.refresh(user)
     return user
@@ -1,20 +1,27 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 from app.api import deps
 from app.models.user import User, UserRole
 from app.models.student_profile import StudentProfile, PortfolioProject, StudentSkill
 from app.schemas import student_profile as profile_schemas
+from app.services.recommendations import refresh_student_vector
+from app.services.talent_search import reindex_student
+from app.utils.etag import check_etag, make_etag
 
 router = APIRouter()
 
 @router.get("/me", response_model=profile_schemas.StudentProfile)
 def read_user_profile_me(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Get current user's profile.
+    Supports If-None-Match: 304 when the profile has not changed since the client's ETag.
     """
     if current_user.role != UserRole.STUDENT and current_user.role != UserRole.ADMIN:
         # Assuming mentors might also want to see, but for now blocking if logic unclear. 
@@ -23,12 +30,22 @@ def read_user_profile_me(
         # If I am an admin, I don't have a student profile.
         pass
         
-    profile = db.query(StudentProfile).filter(StudentProfile.user_id == current_user.id).first()
-    if not profile:
+    marker = (
+        db.query(StudentProfile.id, StudentProfile.updated_at)
+        .filter(StudentProfile.user_id == current_user.id)
+        .first()
+    )
+    if not marker:
         # Return empty structure or 404? 
         # Usually friendly to return empty structure or create one on fly?
         # Let's return 404 to be explicit it doesn't exist yet
         raise HTTPException(status_code=404, detail="Profile not found. Please create one.")
+
+    not_modified = check_etag(request, response, make_etag("profile", marker.id, marker.updated_at))
+    if not_modified:
+        return not_modified
+
+    profile = db.query(StudentProfile).filter(StudentProfile.id == marker.id).first()
     return profile
 
 @router.post("/", response_model=profile_schemas.StudentProfile)
@@ -78,7 +95,11 @@ def create_user_profile(
         )
         db.add(db_skill)
 
+    # Keep the admin talent search index and job recommendations in sync
+    reindex_student(db, current_user.id)
+
     db.commit()
+    refresh_student_vector(db, current_user.id)
     db.refresh(profile)
     return profile
 
@@ -133,7 +154,14 @@ def update_user_profile(
             )
             db.add(db_skill)
 
+    # Child rows may be all that changed; the profile ETag keys on updated_at
+    profile.updated_at = func.now()
+
+    # Keep the admin talent search index and job recommendations in sync
+    reindex_student(db, current_user.id)
+
     db.commit()
+    refresh_student_vector(db, current_user.id)
     db.refresh(profile)
     return profile
 
@@ -0,0 +1,25 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.api import deps
+from app.models.user import User, UserRole
+from app.schemas import talent_search as talent_schemas
+from app.services.talent_search import search_students
+
+router = APIRouter()
+
+@router.get("/", response_model=List[talent_schemas.TalentSearchResult])
+def talent_search(
+    q: str,
+    limit: int = 50,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Find students whose CV, skills or portfolio mention the query terms (Admin only).
+    Supports boolean queries, e.g. "python AND react OR vue" (AND binds tighter than OR).
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return search_students(db, q, limit=min(limit, 200))
+
@@ -1,21 +1,48 @@
-from typing import List, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from sqlalchemy.orm import Session
+import time
+from typing import List, Any, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request, Response, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session, load_only
 from app.api import deps
 from app.models.user import User, UserRole
 from app.models.job import Job, JobStatus
 from app.schemas import job as job_schemas
+from app.services.applied_jobs import get_applied_jobs
+from app.services.ats import build_job_keywords
+from app.services.job_cache import CachedJobPage, job_list_cache
+from app.services.job_facets import count_facets, facet_values, open_job_facets
+from app.services.job_import import import_jobs, iter_import_rows
+from app.utils.etag import BOOT_ID, check_etag, make_etag
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.services.notifications import create_broadcast
+from app.services.outbox import add_event
+from app.services.recommendations import job_index, recommend_jobs
+from app.services.rescoring import get_rescore_progress, request_rescore, rescore_job_applications
+from app.services.unread_counts import record_broadcast
 from pydantic import BaseModel
 
 router = APIRouter()
 
+# Job fields that feed the precomputed ATS keyword index
+KEYWORD_FIELDS = {"requirements", "required_skills", "preferred_skills", "tools"}
+
+# ts_headline options for search result snippets
+SNIPPET_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# view=summary: the only columns loaded, and how much of the description is sent
+SUMMARY_COLUMNS = (
+    Job.id, Job.title, Job.job_type, Job.department, Job.location,
+    Job.deadline, Job.status, Job.admin_id, Job.created_at,
+)
+SUMMARY_EXCERPT_LENGTH = 240
+
 @router.post("/", response_model=job_schemas.Job)
 def create_job(
     *,
     db: Session = Depends(deps.get_db),
     job_in: job_schemas.JobCreate,
     current_user: User = Depends(deps.get_current_active_user),
-    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Create new job posting (Admin only).
@@ -29,43 +56,68 @@ def create_job(
     # Map all fields from Pydantic schema to SQLAlchemy model
     job_data = job_in.dict()
     job = Job(**job_data, admin_id=current_user.id)
+    job.keywords = build_job_keywords(job)
     
     db.add(job)
-    db.commit()
-    db.refresh(job)
     
-    # Broadcast Notification only if OPEN
+    # Notify students only if OPEN, in the same transaction as the job
+    broadcast_id = None
     if job.status == JobStatus.OPEN:
-        from app.models.notification import Notification
-        from app.core.manager import manager
-        
-        # 1. Database Notifications
-        students = db.query(User).filter(User.role == UserRole.STUDENT).all()
-        notifications = []
-        for student in students:
-            notifications.append(Notification(
-                recipient_id=student.id,
-                message=f"New Job Posted: {job.title}",
-                type="info"
-            ))
-        
-        if notifications:
-            db.add_all(notifications)
-            db.commit()
-
-        # 2. WebSocket Broadcast
-        # We need to serialize data properly. Pydantic models can be converted to dict.
-        # But 'created_at' is datetime, which json.dumps fails on unless handled.
-        # FastAPI's jsonable_encoder handles this.
-        from fastapi.encoders import jsonable_encoder
-        ws_message = {
-            "event": "job_posted",
-            "data": jsonable_encoder(job)
-        }
-        background_tasks.add_task(manager.broadcast, ws_message)
+        # 1. Database Notification (one broadcast row for all students)
+        broadcast_id = create_broadcast(db, f"New Job Posted: {job.title}", audience=UserRole.STUDENT.value).id
+
+        # 2. WebSocket Broadcast, delivered by the outbox dispatcher
+        db.flush()
+        db.refresh(job) # load server defaults (created_at) for the payload
+        add_event(db, "job_posted", job)
+
+    db.commit()
+    db.refresh(job)
+    job_index.upsert(job)
+    job_list_cache.bump_version()
+    open_job_facets.apply(None, facet_values(job))
+    if broadcast_id:
+        record_broadcast(UserRole.STUDENT.value, broadcast_id)
         
     return job
 
+@router.post("/import", response_model=job_schemas.JobImportResult)
+def import_jobs_file(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Bulk-create jobs from a CSV (header row with JobCreate fields, list cells as "a; b" or JSON)
+    or JSONL (one JobCreate object per line) upload (Admin only).
+    The file is streamed and inserted in chunks; invalid rows are skipped and reported.
+    Students get one summary notification and broadcast per import.
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can import jobs")
+
+    filename = (file.filename or "").lower()
+    if filename.endswith(".csv") or file.content_type == "text/csv":
+        file_format = "csv"
+    elif filename.endswith((".jsonl", ".ndjson")):
+        file_format = "jsonl"
+    else:
+        raise HTTPException(status_code=400, detail="Upload a .csv or .jsonl file")
+
+    start = time.perf_counter()
+    result = import_jobs(db, current_user.id, iter_import_rows(file.file, file_format))
+    print(f"Imported {result['imported']} jobs ({result['skipped']} skipped) in {time.perf_counter() - start:.2f}s")
+
+    open_jobs = result["open_jobs"]
+    if open_jobs:
+        message = "New Job Posted" if open_jobs == 1 else f"{open_jobs} New Jobs Posted"
+        broadcast_id = create_broadcast(db, message, audience=UserRole.STUDENT.value).id
+        add_event(db, "jobs_imported", {"count": open_jobs})
+        db.commit()
+        record_broadcast(UserRole.STUDENT.value, broadcast_id)
+    return result
+
 class UrlInput(BaseModel):
     url: str
 
@@ -100,9 +152,11 @@ def update_job(
     job_id: int,
     job_in: job_schemas.JobUpdate,
     current_user: User = Depends(deps.get_current_active_user),
+    background_tasks: BackgroundTasks,
 ) -> Any:
     """
     Update a job (Admin only).
+    Changing requirements or skill lists re-scores existing applications in the background.
     """
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -115,73 +169,290 @@ def update_job(
     if job.admin_id != current_user.id:
          raise HTTPException(status_code=403, detail="You can only edit jobs you posted")
 
+    facets_before = facet_values(job)
     update_data = job_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(job, field, value)
 
+    keywords_changed = False
+    if KEYWORD_FIELDS.intersection(update_data):
+        keywords = build_job_keywords(job)
+        keywords_changed = keywords != job.keywords
+        job.keywords = keywords
+
     db.add(job)
     db.commit()
     db.refresh(job)
+    job_index.upsert(job)
+    job_list_cache.bump_version()
+    open_job_facets.apply(facets_before, facet_values(job))
+
+    # Existing ATS scores are stale now, re-rank applicants without holding up this request
+    if keywords_changed and request_rescore(job.id):
+        background_tasks.add_task(rescore_job_applications, job.id)
     return job
 
-@router.get("/", response_model=List[job_schemas.Job])
+def _get_own_job(db: Session, job_id: int, current_user: User) -> Job:
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.admin_id != current_user.id:
+        raise HTTPException(status_code=403, detail="You can only manage jobs you posted")
+    return job
+
+def _job_filters(
+    current_user: User,
+    *,
+    job_type: Optional[str],
+    department: Optional[str],
+    location: Optional[str],
+    status: Optional[str],
+    tsquery=None,
+) -> list:
+    """
+    WHERE conditions for the jobs a user may see under the given filters.
+    """
+    # Visibility Rules
+    if current_user.role == UserRole.STUDENT:
+        conditions = [Job.status == JobStatus.OPEN]
+    elif current_user.role == UserRole.ADMIN:
+        conditions = [Job.admin_id == current_user.id] # Only show own jobs
+        if status:
+            conditions.append(Job.status == status)
+    else:
+        conditions = []
+
+    if job_type:
+        conditions.append(Job.job_type == job_type)
+    if department:
+        conditions.append(Job.department == department)
+    if location:
+        conditions.append(Job.location == location)
+    if tsquery is not None:
+        conditions.append(Job.search_vector.op("@@")(tsquery))
+    return conditions
+
+def _list_jobs(
+    db: Session,
+    current_user: User,
+    *,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    q: Optional[str],
+    job_type: Optional[str],
+    department: Optional[str],
+    location: Optional[str],
+    status: Optional[str],
+    sort_by: str,
+    view: str,
+) -> Tuple[List[Job], Optional[str]]:
+    """
+    One page of jobs visible to the user, plus the cursor of the next page (None on the last page).
+    view=summary loads only SUMMARY_COLUMNS plus a description excerpt computed in SQL.
+    """
+    tsquery = func.websearch_to_tsquery("english", q) if q else None
+    query = db.query(Job).filter(*_job_filters(
+        current_user, job_type=job_type, department=department, location=location,
+        status=status, tsquery=tsquery,
+    ))
+
+    # Computed columns set as attributes on each job: (attribute, expression)
+    extra_columns = []
+    if view == "summary":
+        query = query.options(load_only(*SUMMARY_COLUMNS))
+        extra_columns.append(("excerpt", func.left(Job.description, SUMMARY_EXCERPT_LENGTH)))
+    if tsquery is not None:
+        extra_columns.append((
+            "snippet",
+            func.ts_headline("english", func.coalesce(Job.description, ""), tsquery, SNIPPET_OPTIONS),
+        ))
+    if extra_columns:
+        query = query.add_columns(*[expression for _, expression in extra_columns])
+
+    # id breaks ties between jobs created in the same instant, so the order is total
+    if sort_by == "relevance":
+        query = query.order_by(func.ts_rank(Job.search_vector, tsquery).desc(), Job.id.desc())
+    elif sort_by == "oldest":
+        query = query.order_by(Job.created_at.asc(), Job.id.asc())
+    else: # Default to newest
+        query = query.order_by(Job.created_at.desc(), Job.id.desc())
+
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        position = tuple_(Job.created_at, Job.id)
+        if sort_by == "oldest":
+            query = query.filter(position > tuple_(cursor_created_at, cursor_id))
+        else:
+            query = query.filter(position < tuple_(cursor_created_at, cursor_id))
+    else:
+        query = query.offset(skip)
+
+    if extra_columns:
+        jobs = []
+        for job, *values in query.limit(limit).all():
+            for (attribute, _), value in zip(extra_columns, values):
+                setattr(job, attribute, value)
+            jobs.append(job)
+    else:
+        jobs = query.limit(limit).all()
+
+    next_cursor = None
+    if jobs and len(jobs) == limit and sort_by != "relevance":
+        next_cursor = encode_cursor(jobs[-1].created_at, jobs[-1].id)
+    return jobs, next_cursor
+
+# Job first: a full job also validates as a JobSummary, but not the other way round
+@router.get("/", response_model=Union[List[job_schemas.Job], List[job_schemas.JobSummary]])
 def read_jobs(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None, # opaque keyset cursor from the X-Next-Cursor header
+    q: Optional[str] = None, # full-text search, e.g. "python -java" or "\"machine learning\""
+
     job_type: Optional[str] = None,
     department: Optional[str] = None,
+    location: Optional[str] = None,
     status: Optional[str] = None,
     application_status: Optional[str] = None, # applied, not_applied
-    sort_by: Optional[str] = "newest", # newest, oldest
+    sort_by: Optional[str] = None, # newest, oldest, relevance (default with q, otherwise newest)
+    view: str = "full", # full, summary (JobSummary rows for list views; details via GET /jobs/{job_id})
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Retrieve jobs.
     Students: Only see 'Open' jobs. Can filter by 'applied' or 'not_applied'.
     Admins: Can see all (Drafts, Closed), and filter by status.
+    Search: `q` matches title, skills, tools, requirements and description (GIN-indexed tsvector);
+    results carry a highlighted `snippet` and are ranked by relevance unless sort_by says otherwise.
+    Pagination: pass the X-Next-Cursor response header back as `cursor` for the next page
+    (constant cost at any depth, stable while new jobs are posted). `skip` still works,
+    and is the only option for relevance order.
+    Student pages are served from a shared cache; every job is marked `applied` from the student's
+    in-memory applied-job set, and `application_status` filters the cached page with it,
+    so a filtered page can hold fewer than `limit` jobs while more follow behind X-Next-Cursor.
+    Supports If-None-Match: 304 when nothing on the page can have changed since the client's ETag.
     """
-    query = db.query(Job)
+    if not sort_by:
+        sort_by = "relevance" if q else "newest"
+    if sort_by == "relevance" and not q:
+        raise HTTPException(status_code=400, detail="sort_by=relevance requires a search query")
+    if sort_by == "relevance" and cursor:
+        raise HTTPException(status_code=400, detail="Cursor pagination is not available for relevance order")
+    if view not in ("full", "summary"):
+        raise HTTPException(status_code=400, detail="view must be 'full' or 'summary'")
+    schema = job_schemas.JobSummary if view == "summary" else job_schemas.Job
 
-    # Visibility Rules
-    if current_user.role == UserRole.STUDENT:
-        query = query.filter(Job.status == JobStatus.OPEN)
-        
-        # Filter by Application Status (Student specific)
-        if application_status:
-            from app.models.application import Application
-            # Outer join to check for existence of application by this user
-            query = query.outerjoin(
-                Application, 
-                (Job.id == Application.job_id) & (Application.student_id == current_user.id)
-            )
-            
-            if application_status == "applied":
-                query = query.filter(Application.id.isnot(None))
-            elif application_status == "not_applied":
-                query = query.filter(Application.id.is_(None))
-                
-    elif current_user.role == UserRole.ADMIN:
-        query = query.filter(Job.admin_id == current_user.id) # Only show own jobs
-        if status:
-             query = query.filter(Job.status == status)
+    page_args = dict(
+        skip=skip, limit=limit, cursor=cursor, q=q,
+        job_type=job_type, department=department, location=location, status=status, sort_by=sort_by,
+        view=view,
+    )
+    if current_user.role != UserRole.STUDENT:
+        count, last_change = (
+            db.query(func.count(Job.id), func.max(func.coalesce(Job.updated_at, Job.created_at)))
+            .filter(Job.admin_id == current_user.id)
+            .one()
+        )
+        etag = make_etag("jobs", current_user.id, count, last_change, sorted(page_args.items()))
+        not_modified = check_etag(request, response, etag)
+        if not_modified:
+            return not_modified
 
-    if job_type:
-        query = query.filter(Job.job_type == job_type)
-    if department:
-        query = query.filter(Job.department == department)
-    
-    if sort_by == "oldest":
-        query = query.order_by(Job.created_at.asc())
-    else: # Default to newest
-        query = query.order_by(Job.created_at.desc())
+        jobs, next_cursor = _list_jobs(db, current_user, **page_args)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return [schema.model_validate(job) for job in jobs]
+
+    # Students all see the same open-job pages: serve them from the shared cache
+    cache_key = (skip, limit, cursor, q, job_type, department, location, sort_by, view)
+    applied = get_applied_jobs(db, current_user.id)
+    etag = make_etag(
+        "jobs", BOOT_ID, job_list_cache.version, cache_key, application_status,
+        len(applied), applied.checksum(),
+    )
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    page = job_list_cache.get(cache_key)
+    if page is None:
+        version = job_list_cache.version
+        jobs, next_cursor = _list_jobs(db, current_user, **page_args)
+        page = CachedJobPage(jsonable_encoder([schema.model_validate(job) for job in jobs]), next_cursor)
+        job_list_cache.put(cache_key, version, page)
 
-    jobs = query.offset(skip).limit(limit).all()
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+
+    # Annotate and filter by Application Status (Student specific) on top of the shared page
+    jobs = [{**job, "applied": job["id"] in applied} for job in page.jobs]
+    if application_status in ("applied", "not_applied"):
+        want_applied = application_status == "applied"
+        jobs = [job for job in jobs if job["applied"] == want_applied]
     return jobs
 
+@router.get("/facets", response_model=job_schemas.JobFacets)
+def read_job_facets(
+    db: Session = Depends(deps.get_db),
+    q: Optional[str] = None,
+    job_type: Optional[str] = None,
+    department: Optional[str] = None,
+    location: Optional[str] = None,
+    status: Optional[str] = None,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Number of jobs per job_type, department, location and status value under the current filters,
+    over the same jobs GET /jobs/ would return.
+    The unfiltered student view is answered from in-memory counts kept current on job writes.
+    """
+    filters = dict(job_type=job_type, department=department, location=location)
+    if current_user.role == UserRole.STUDENT and not q and not any(filters.values()):
+        if not open_job_facets.loaded:
+            open_job_facets.load(db)
+        return open_job_facets.snapshot()
+
+    tsquery = func.websearch_to_tsquery("english", q) if q else None
+    return count_facets(db, _job_filters(current_user, status=status, tsquery=tsquery, **filters))
+
+@router.get("/cache-stats")
+def read_job_cache_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Hit/miss counters and size of the student job listing cache (Admin only).
+    """
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    return job_list_cache.stats()
+
+@router.get("/recommended", response_model=List[job_schemas.RecommendedJob])
+def read_recommended_jobs(
+    db: Session = Depends(deps.get_db),
+    limit: int = 20,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Open jobs ranked by fit to the current student's CV and profile skills (Student only).
+    """
+    if current_user.role != UserRole.STUDENT:
+        raise HTTPException(status_code=403, detail="Only students get job recommendations")
+    return recommend_jobs(db, current_user.id, limit=min(limit, 100))
+
 @router.get("/{job_id}", response_model=job_schemas.Job)
 def read_job(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     job_id: int,
     current_user: User = Depends(deps.get_current_active_user),
@@ -189,12 +460,50 @@ def read_job(
     """
     Get job by ID.
     Students cannot view Draft/Closed jobs.
+    Supports If-None-Match: 304 when the job has not changed since the client's ETag.
     """
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    marker = db.query(Job.status, Job.created_at, Job.updated_at).filter(Job.id == job_id).first()
+    if not marker:
         raise HTTPException(status_code=404, detail="Job not found")
         
-    if current_user.role == UserRole.STUDENT and job.status != JobStatus.OPEN:
+    if current_user.role == UserRole.STUDENT and marker.status != JobStatus.OPEN:
          raise HTTPException(status_code=404, detail="Job not found") # Hide non-open jobs
 
+    not_modified = check_etag(request, response, make_etag("job", job_id, marker.updated_at or marker.created_at))
+    if not_modified:
+        return not_modified
+
+    job = db.query(Job).filter(Job.id == job_id).first()
     return job
+
+@router.post("/{job_id}/rescore", response_model=job_schemas.RescoreProgress)
+def rescore_job(
+    *,
+    db: Session = Depends(deps.get_db),
+    job_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+    background_tasks: BackgroundTasks,
+) -> Any:
+    """
+    Re-score all applications of a job (Admin only).
+    """
+    job = _get_own_job(db, job_id, current_user)
+    if request_rescore(job.id):
+        background_tasks.add_task(rescore_job_applications, job.id)
+    return get_rescore_progress(job.id)
+
+@router.get("/{job_id}/rescore", response_model=job_schemas.RescoreProgress)
+def read_rescore_progress(
+    *,
+    db: Session = Depends(deps.get_db),
+    job_id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Progress of the latest re-scoring run of a job (Admin only).
+    """
+    job = _get_own_job(db, job_id, current_user)
+    progress = get_rescore_progress(job.id)
+    if not progress:
+        raise HTTPException(status_code=404, detail="No re-scoring has run for this job")
+    return progress
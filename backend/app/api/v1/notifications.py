@@ -1,32 +1,56 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from app import models
 from app.schemas import notification as notification_schemas
 from app.api import deps
+from app.services import notifications as notification_service
+from app.services import unread_counts
+from app.services.outbox import add_event
+from app.utils.pagination import decode_cursor
 
 router = APIRouter()
 
+def _decode(cursor: str) -> Tuple[datetime, int]:
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @router.get("/", response_model=List[notification_schemas.Notification])
 def read_notifications(
+    response: Response,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None, # opaque keyset cursor from the X-Next-Cursor header
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Retrieve notifications for the current user.
+    Retrieve notifications for the current user, including broadcasts to their role.
+    Pagination: pass the X-Next-Cursor response header back as `cursor` for the next page
+    (`skip` is kept for older clients and ignored with a cursor).
     """
-    notifications = (
-        db.query(models.Notification)
-        .filter(models.Notification.recipient_id == current_user.id)
-        .order_by(models.Notification.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    after = _decode(cursor) if cursor else None
+    notifications, next_cursor = notification_service.list_notifications(
+        db, current_user, skip=skip, limit=limit, after=after
     )
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return notifications
 
+@router.get("/unread-count", response_model=notification_schemas.UnreadCount)
+def read_unread_count(
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Number of unread notifications for the badge. Served from memory once loaded;
+    changes are also pushed over the WebSocket as "unread_count" events.
+    """
+    return {"count": unread_counts.get_unread_count(db, current_user)}
+
 @router.put("/{notification_id}/read", response_model=notification_schemas.Notification)
 def mark_notification_as_read(
     notification_id: int,
@@ -34,40 +58,69 @@ def mark_notification_as_read(
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Mark a notification as read.
+    Mark a notification as read. For a broadcast (negative id) this also marks
+    every older broadcast read.
     """
+    if notification_id < 0:
+        broadcast = notification_service.get_broadcast(db, current_user, -notification_id)
+        if not broadcast:
+            raise HTTPException(status_code=404, detail="Notification not found")
+        notification_service.advance_read_cursor(db, current_user.id, broadcast.id)
+        add_event(db, "unread_count_changed", {"user_ids": [current_user.id]})
+        db.commit()
+        unread_counts.record_cursor(current_user.id, broadcast.id)
+        return notification_service.broadcast_payload(broadcast, current_user.id, broadcast.id)
+
     notification = db.query(models.Notification).filter(models.Notification.id == notification_id).first()
     if not notification:
         raise HTTPException(status_code=404, detail="Notification not found")
     if notification.recipient_id != current_user.id:
         raise HTTPException(status_code=400, detail="Not enough permissions")
     
+    was_unread = not notification.is_read
     notification.is_read = True
     db.add(notification)
+    if was_unread:
+        add_event(db, "unread_count_changed", {"user_ids": [current_user.id]})
     db.commit()
     db.refresh(notification)
+    if was_unread:
+        unread_counts.record_read(current_user.id)
     return notification
 
-@router.put("/read-all", response_model=List[notification_schemas.Notification])
+def _acknowledged(db: Session, user: models.User, personal: int, broadcasts: int, cursor: int, all_read: bool = False) -> dict:
+    if personal or broadcasts:
+        add_event(db, "unread_count_changed", {"user_ids": [user.id]})
+    db.commit()
+    if personal:
+        unread_counts.record_read(user.id)
+    unread_counts.record_cursor(user.id, cursor, all_read=all_read)
+    return {"marked_read": personal + broadcasts, "unread_count": unread_counts.get_unread_count(db, user)}
+
+@router.post("/ack", response_model=notification_schemas.NotificationAckResult)
+def acknowledge_notifications(
+    ack: notification_schemas.NotificationAck,
+    db: Session = Depends(deps.get_db),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Mark several notifications read in one request: the given ids (broadcasts are negative)
+    and/or, as a watermark, every notification at or older than `up_to_cursor` (an X-Next-Cursor
+    value, i.e. the last notification of a page). Returns counts only.
+    """
+    if not ack.ids and not ack.up_to_cursor:
+        raise HTTPException(status_code=400, detail="Provide ids or up_to_cursor")
+    up_to = _decode(ack.up_to_cursor) if ack.up_to_cursor else None
+    personal, broadcasts, cursor = notification_service.mark_read(db, current_user, ids=ack.ids, up_to=up_to)
+    return _acknowledged(db, current_user, personal, broadcasts, cursor)
+
+@router.put("/read-all", response_model=notification_schemas.NotificationAckResult)
 def mark_all_as_read(
     db: Session = Depends(deps.get_db),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Mark all notifications as read for current user.
+    Mark all notifications as read for current user. Returns counts only.
     """
-    db.query(models.Notification).filter(
-        models.Notification.recipient_id == current_user.id,
-        models.Notification.is_read == False
-    ).update({"is_read": True})
-    
-    db.commit()
-    
-    # Return updated list
-    return (
-        db.query(models.Notification)
-        .filter(models.Notification.recipient_id == current_user.id)
-        .order_by(models.Notification.created_at.desc())
-        .limit(100)
-        .all()
-    )
+    personal, broadcasts, cursor = notification_service.mark_read(db, current_user, everything=True)
+    return _acknowledged(db, current_user, personal, broadcasts, cursor, all_read=True)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from app.api.v1 import auth, projects, users, jobs, applications, notifications, websockets
-from app.api.v1.endpoints import password_reset, cv, test_email, student_profile
+from app.api.v1.endpoints import password_reset, cv, test_email, student_profile, talent_search
 
 api_router = APIRouter()
 api_router.include_router(auth.router, tags=["login"])
@@ -13,4 +13,5 @@ api_router.include_router(notifications.router, prefix="/notifications", tags=["
 api_router.include_router(websockets.router, tags=["websockets"])
 api_router.include_router(cv.router, prefix="/cv", tags=["cv"])
 api_router.include_router(student_profile.router, prefix="/student-profile", tags=["student-profile"])
+api_router.include_router(talent_search.router, prefix="/talent-search", tags=["talent-search"])
 api_router.include_router(test_email.router, tags=["test-email"])
@@ -1,10 +1,13 @@
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.api import deps
 from app.models.user import User
 from app.schemas import user as user_schemas
 from app.core.security import verify_password, get_password_hash
+from app.services.cv_extraction import extract_cv_text_async
+from app.services.cv_text import apply_cv_text, begin_cv_text, complete_cv_text, fail_cv_text
 
 router = APIRouter()
 
@@ -48,7 +51,20 @@ async def upload_cv(
     # Update user profile
     current_user.cv_filename = filename
     db.add(current_user)
+
+    # Extract the CV text once here so ATS scoring never has to parse the PDF again.
+    # pdfminer runs in a separate process pool, bounded by a timeout and a memory cap.
+    # Until it finishes, applications of this student are scored as "pending"; if this
+    # request dies before that, the extraction queued with the pending row takes over.
+    cv_text = begin_cv_text(db, current_user, contents)
     db.commit()
+    if cv_text is not None:
+        try:
+            complete_cv_text(cv_text, await extract_cv_text_async(contents))
+        except Exception as e:
+            fail_cv_text(cv_text, str(e))
+        await run_in_threadpool(apply_cv_text, db, cv_text)
+
     db.refresh(current_user)
     
     return current_user
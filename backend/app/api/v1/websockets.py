@@ -42,10 +42,8 @@ async def websocket_endpoint(
             await websocket.close(code=4003) # Forbidden
             return
 
-        await manager.connect(websocket, user.id)
-        
-        # Determine role for targeted messaging later?
-        # For now, we just track by user_id.
+        # Tracked by user and role for targeted messaging
+        await manager.connect(websocket, user.id, user.role)
 
         try:
             while True:
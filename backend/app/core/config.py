@@ -26,6 +26,30 @@ class Settings(BaseSettings):
     SUPABASE_URL: str
     SUPABASE_KEY: str
 
+    # CV text extraction (dedicated process pool)
+    CV_EXTRACTION_WORKERS: int = 2
+    CV_EXTRACTION_TIMEOUT_SECONDS: int = 20
+    CV_EXTRACTION_MAX_MEMORY_MB: int = 512
+    CV_EXTRACTION_MAX_PAGES: int = 20
+
+    # In-process cache of student job listing pages
+    JOB_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # How often open jobs past their deadline are closed
+    JOB_DEADLINE_SWEEP_SECONDS: int = 60
+
+    # Outbox dispatcher (domain events -> WebSocket, email, ...)
+    OUTBOX_POLL_SECONDS: float = 1.0
+    OUTBOX_BATCH_SIZE: int = 100
+    OUTBOX_MAX_ATTEMPTS: int = 10
+    OUTBOX_RETRY_SECONDS: int = 30 # first retry delay, doubles per attempt
+    OUTBOX_DEAD_LETTER_RETENTION_DAYS: int = 30 # dead letters older than this are pruned (maintain_outbox.py)
+
+    # Notification retention (run maintain_notifications.py periodically)
+    NOTIFICATION_RETENTION_DAYS: int = 180 # read notifications in months older than this are removed
+    NOTIFICATION_RETENTION_MODE: str = "delete" # delete, archive (copy to notification_archive first)
+    NOTIFICATION_PARTITIONS_AHEAD: int = 2 # monthly partitions created ahead of time
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,17 +1,23 @@
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Set
 from fastapi import WebSocket
 
 class ConnectionManager:
+    """
+    Open WebSockets, indexed by user and by role so events only go to their audience.
+    """
     def __init__(self):
-        # active_connections: List[WebSocket] = []
-        # We can map user_id to a list of sockets (user might have multiple tabs)
+        # A user might have multiple sockets (tabs)
         self.active_connections: Dict[int, List[WebSocket]] = {}
+        self.user_roles: Dict[int, str] = {}
+        self.users_by_role: Dict[str, Set[int]] = {}
 
-    async def connect(self, websocket: WebSocket, user_id: int):
+    async def connect(self, websocket: WebSocket, user_id: int, role: str):
         await websocket.accept()
         if user_id not in self.active_connections:
             self.active_connections[user_id] = []
         self.active_connections[user_id].append(websocket)
+        self.user_roles[user_id] = role
+        self.users_by_role.setdefault(role, set()).add(user_id)
 
     def disconnect(self, websocket: WebSocket, user_id: int):
         if user_id in self.active_connections:
@@ -19,31 +25,38 @@ class ConnectionManager:
                 self.active_connections[user_id].remove(websocket)
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
+                role = self.user_roles.pop(user_id, None)
+                if role is not None:
+                    self.users_by_role.get(role, set()).discard(user_id)
+
+    async def send_to_users(self, message: Any, user_ids: Iterable[int]) -> int:
+        """
+        Send message to every socket of the given users that are connected. Returns the frames sent.
+        """
+        sent = 0
+        dead = []
+        for user_id in user_ids:
+            for connection in list(self.active_connections.get(user_id, ())):
+                try:
+                    await connection.send_json(message)
+                    sent += 1
+                except Exception:
+                    # Closed socket that hasn't disconnected yet; don't fail the other clients
+                    dead.append((connection, user_id))
+        for connection, user_id in dead:
+            self.disconnect(connection, user_id)
+        return sent
 
     async def send_personal_message(self, message: Any, user_id: int):
-        if user_id in self.active_connections:
-            for connection in self.active_connections[user_id]:
-                await connection.send_json(message)
+        await self.send_to_users(message, [user_id])
+
+    async def broadcast_to_role(self, message: Any, role: str):
+        """Send message to all connected users of a role."""
+        await self.send_to_users(message, list(self.users_by_role.get(role, ())))
 
     async def broadcast(self, message: Any):
         """Send message to all connected clients."""
-        for user_sockets in self.active_connections.values():
-            for connection in user_sockets:
-                await connection.send_json(message)
-
-    async def broadcast_to_role(self, message: Any, role: str, db_check_callback=None):
-        """
-        Broadcast to users of a specific role.
-        Note: Since we store user_id, we might need to know the role.
-        Simple approach: Client can filter, OR we store (user_id, role) tuple.
-        For now, let's just broadcast to provided user_ids if known, 
-        or simplest: Broadcast all, let client filter? 
-        Better: Broadcast all is fine for 'Job Posted' (public info).
-        For 'Application Submitted' (Admin only), we need to know who is admin.
-        
-        Alternative: Store role in active_connections: Dict[int, Dict['ws': WebSocket, 'role': str]]
-        """
-        pass
+        await self.send_to_users(message, list(self.active_connections))
 
 # Global instance
 manager = ConnectionManager()
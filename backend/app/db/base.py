@@ -6,3 +6,7 @@ from app.models.activity_log import ActivityLog  # noqa
 from app.models.job import Job  # noqa
 from app.models.application import Application  # noqa
 from app.models.student_profile import StudentProfile, PortfolioProject, StudentSkill  # noqa
+from app.models.cv_text import CVText  # noqa
+from app.models.talent_posting import TalentPosting  # noqa
+from app.models.broadcast_notification import BroadcastNotification, NotificationCursor  # noqa
+from app.models.outbox_event import OutboxEvent, OutboxDeadLetter  # noqa
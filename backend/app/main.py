@@ -1,11 +1,32 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.services.deadline_sweeper import run_deadline_sweeper
+from app.services.notification_retention import ensure_partitions_on_startup
+from app.services.outbox import run_outbox_dispatcher
+import app.services.event_consumers  # noqa: F401 - registers the outbox consumers
 import traceback
 
-app = FastAPI(title=settings.PROJECT_NAME)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Make sure this month's notification partition (and the next ones) exist
+    await run_in_threadpool(ensure_partitions_on_startup)
+    # Background jobs live as long as the app
+    tasks = [asyncio.create_task(run_deadline_sweeper()), asyncio.create_task(run_outbox_dispatcher())]
+    yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan)
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -22,6 +43,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
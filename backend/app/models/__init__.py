@@ -1,5 +1,9 @@
 from .user import User
 from .job import Job
 from .application import Application
-from .notification import Notification
+from .notification import Notification, NotificationArchive
 from .password_reset import PasswordResetToken
+from .cv_text import CVText
+from .talent_posting import TalentPosting
+from .broadcast_notification import BroadcastNotification, NotificationCursor
+from .outbox_event import OutboxEvent, OutboxDeadLetter
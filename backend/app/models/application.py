@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Enum
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Float, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base_class import Base
@@ -10,16 +10,32 @@ class ApplicationStatus(str, enum.Enum):
     ACCEPTED = "accepted"
     REJECTED = "rejected"
 
+class ScoreStatus(str, enum.Enum):
+    SCORED = "scored"
+    PENDING = "pending" # CV text not extracted yet
+    FAILED = "failed" # CV text could not be extracted
+
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # Admin listing per job, by date or by ATS score (also serves min_score)
+        Index("ix_applications_job_created_at", "job_id", "created_at"),
+        Index("ix_applications_job_ats_score", "job_id", "ats_score"),
+        # Admin listing across all own jobs, newest first
+        Index("ix_applications_created_at", "created_at"),
+        # A student's applications / "already applied" checks
+        Index("ix_applications_student_job", "student_id", "job_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     job_id = Column(Integer, ForeignKey("jobs.id"))
     student_id = Column(Integer, ForeignKey("users.id"))
     cv_snapshot_path = Column(String, nullable=True) # Path to CV at time of application
     ats_score = Column(Float, default=0.0)
+    ats_status = Column(String, default=ScoreStatus.SCORED.value, server_default=ScoreStatus.SCORED.value)
     status = Column(String, default=ApplicationStatus.APPLIED)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     job = relationship("Job", back_populates="applications")
     student = relationship("User", backref="applications")
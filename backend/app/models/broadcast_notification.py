@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Index
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class BroadcastNotification(Base):
+    """
+    One row per event sent to everyone (or to every user of one role), fanned out on read.
+    API clients see broadcasts with negative ids so they never collide with personal notifications.
+    """
+    __tablename__ = "broadcast_notifications"
+    __table_args__ = (
+        # Newest broadcasts for an audience
+        Index("ix_broadcast_notifications_audience_id", "audience", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    audience = Column(String, nullable=True) # UserRole value, None = every user
+    message = Column(Text, nullable=False)
+    type = Column(String, default="info") # info, success, warning, error
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class NotificationCursor(Base):
+    """
+    Per-user read position in the broadcast stream: broadcasts with id <= last_read_broadcast_id are read.
+    Broadcasts with id <= joined_broadcast_id predate the user and are not shown to them.
+    Users without a row get one on first use.
+    """
+    __tablename__ = "notification_cursors"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    last_read_broadcast_id = Column(Integer, nullable=False, default=0)
+    joined_broadcast_id = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
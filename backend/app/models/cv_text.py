@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, JSON
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+import enum
+
+class CVTextStatus(str, enum.Enum):
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+class CVText(Base):
+    __tablename__ = "cv_texts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), unique=True, index=True, nullable=False)
+    content_hash = Column(String, nullable=False) # sha256 of the uploaded PDF bytes
+    text = Column(Text, nullable=False, default="") # Normalized (lower-cased, whitespace collapsed) text
+    term_counts = Column(JSON, default=dict) # Dict[str, int] token -> occurrences
+    token_count = Column(Integer, default=0)
+    status = Column(String, default=CVTextStatus.PENDING.value)
+    error = Column(Text, nullable=True) # Why extraction failed (timeout, memory cap, unreadable PDF)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    user = relationship("User", back_populates="cv_text")
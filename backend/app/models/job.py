@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Enum, JSON
-from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Enum, JSON, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.sql import func, text
 from app.db.base_class import Base
 import enum
 
@@ -14,8 +15,27 @@ class JobLocation(str, enum.Enum):
     ONSITE = "Onsite"
     HYBRID = "Hybrid"
 
+# Full-text document of a job, maintained by Postgres (generated column).
+# Title ranks highest, then skills/tools/requirements, then the description.
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(required_skills::text, '') || ' ' || "
+    "coalesce(preferred_skills::text, '') || ' ' || coalesce(tools::text, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(requirements, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # Student listing: open jobs in (created_at, id) keyset order
+        Index("ix_jobs_open_created_at", "created_at", "id", postgresql_where=text("status = 'Open'")),
+        # Admin listing: own jobs in (created_at, id) order
+        Index("ix_jobs_admin_created_at", "admin_id", "created_at", "id"),
+        # Deadline sweeper: open jobs that have a deadline
+        Index("ix_jobs_open_deadline", "deadline", postgresql_where=text("status = 'Open' AND deadline IS NOT NULL")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
@@ -40,6 +60,12 @@ class Job(Base):
     preferred_skills = Column(JSON, default=list) # List[str]
     tools = Column(JSON, default=list) # List[str]
     min_qualifications = Column(Text, nullable=True)
+
+    # Normalized ATS keyword -> weight, rebuilt whenever requirements/skills/tools change
+    keywords = Column(JSON, nullable=True)
+
+    # Deferred: only the search query needs it, never load it with the row
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True)))
     
     admin_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,15 +1,39 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Text, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class Notification(Base):
     __tablename__ = "notification"
-    id = Column(Integer, primary_key=True, index=True)
+    __table_args__ = (
+        # A user's notifications, newest first; id breaks created_at ties for keyset paging
+        Index("ix_notification_recipient_created_at_id", "recipient_id", "created_at", "id"),
+        # Unread lookups only touch the (small) unread part of the table
+        Index("ix_notification_recipient_unread", "recipient_id", postgresql_where=text("NOT is_read")),
+        # Monthly partitions (notification_YYYY_MM), managed by app/services/notification_retention.py
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     recipient_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     message = Column(Text, nullable=False)
     type = Column(String, default="info") # info, success, warning, error
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now()) # partition key
 
     recipient = relationship("User", back_populates="notifications")
+
+class NotificationArchive(Base):
+    """
+    Read notifications moved out of `notification` by the retention policy (NOTIFICATION_RETENTION_MODE=archive).
+    """
+    __tablename__ = "notification_archive"
+    __table_args__ = (
+        Index("ix_notification_archive_recipient_created_at", "recipient_id", "created_at"),
+    )
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    recipient_id = Column(Integer, nullable=False)
+    message = Column(Text, nullable=False)
+    type = Column(String)
+    is_read = Column(Boolean)
+    created_at = Column(DateTime(timezone=True), primary_key=True)
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, JSON, Index
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class OutboxEvent(Base):
+    """
+    Domain event written in the same transaction as the change it describes.
+    The outbox dispatcher delivers it to the registered consumers and deletes it;
+    failed deliveries are retried until OUTBOX_MAX_ATTEMPTS, then moved to outbox_dead_letters.
+    """
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # Dispatcher claim: oldest events that are due
+        Index("ix_outbox_events_available_at_id", "available_at", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    event = Column(String, nullable=False) # job_posted, application_submitted, ...
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now()) # not claimable before
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+class OutboxDeadLetter(Base):
+    """
+    Outbox event that failed OUTBOX_MAX_ATTEMPTS times, moved out of outbox_events with its last error.
+    Inspect, requeue or prune with maintain_outbox.py.
+    """
+    __tablename__ = "outbox_dead_letters"
+
+    id = Column(BigInteger, primary_key=True) # id it had in outbox_events
+    event = Column(String, nullable=False, index=True)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True))
+    failed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Enum, Text, DateTime
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.db.base_class import Base
 import enum
 
@@ -16,6 +17,8 @@ class StudentProfile(Base):
     github_url = Column(String, nullable=True)
     linkedin_url = Column(String, nullable=True)
     portfolio_url = Column(String, nullable=True)
+    # Touched on every profile write, including project/skill replacement
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationship to User
     user = relationship("User", back_populates="student_profile")
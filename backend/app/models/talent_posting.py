@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, ForeignKey
+from app.db.base_class import Base
+
+class TalentPosting(Base):
+    """
+    Inverted index entry for admin talent search: term -> student with term frequency.
+    Built from the student's CV text, skills and portfolio project descriptions.
+    """
+    __tablename__ = "talent_postings"
+
+    term = Column(String, primary_key=True)
+    student_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, index=True)
+    tf = Column(Integer, nullable=False, default=1)
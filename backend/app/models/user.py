@@ -28,4 +28,5 @@ class User(Base):
     notifications = relationship("Notification", back_populates="recipient")
     reset_tokens = relationship("PasswordResetToken", back_populates="user")
     student_profile = relationship("StudentProfile", back_populates="user", uselist=False, cascade="all, delete-orphan")
+    cv_text = relationship("CVText", back_populates="user", uselist=False, cascade="all, delete-orphan")
 
@@ -1,7 +1,7 @@
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
-from app.models.application import ApplicationStatus
+from app.models.application import ApplicationStatus, ScoreStatus
 
 class ApplicationBase(BaseModel):
     pass
@@ -18,6 +18,7 @@ class ApplicationInDBBase(ApplicationBase):
     student_id: int
     cv_snapshot_path: Optional[str] = None
     ats_score: float
+    ats_status: Optional[ScoreStatus] = None
     status: ApplicationStatus
     created_at: datetime
     
@@ -33,3 +34,4 @@ from app.schemas.job import Job
 class Application(ApplicationInDBBase):
     student: Optional[User] = None
     job: Optional[Job] = None
+    relevance: Optional[float] = None # BM25 score, only set when listing with sort_by=relevance
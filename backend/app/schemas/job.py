@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from pydantic import BaseModel, validator, Field, field_validator
 
@@ -67,4 +67,55 @@ class JobInDBBase(JobBase):
         from_attributes = True
 
 class Job(JobInDBBase):
-    pass
+    snippet: Optional[str] = None # Highlighted description excerpt, only set for q= searches
+    applied: Optional[bool] = None # Whether the current student applied, only set in student listings
+
+class JobSummary(BaseModel):
+    """
+    List-view projection of a job: no long text or JSON arrays, just a short description excerpt.
+    """
+    id: int
+    title: str
+    job_type: Optional[str] = None
+    department: Optional[str] = None
+    location: Optional[str] = None
+    deadline: Optional[datetime] = None
+    status: Optional[str] = None
+    admin_id: int
+    created_at: datetime
+    excerpt: Optional[str] = None # First SUMMARY_EXCERPT_LENGTH characters of the description
+    snippet: Optional[str] = None
+    applied: Optional[bool] = None
+
+    class Config:
+        from_attributes = True
+
+class RecommendedJob(Job):
+    match_score: float # Cosine similarity between the job and the student's CV/skills
+
+class JobFacets(BaseModel):
+    # facet value -> number of matching jobs
+    job_type: Dict[str, int] = {}
+    department: Dict[str, int] = {}
+    location: Dict[str, int] = {}
+    status: Dict[str, int] = {}
+    total: int = 0
+
+class JobImportError(BaseModel):
+    line: int
+    error: str
+
+class JobImportResult(BaseModel):
+    imported: int
+    open_jobs: int # imported jobs published as Open (students were notified about these)
+    skipped: int
+    errors: List[JobImportError] = [] # first rows that failed validation
+
+class RescoreProgress(BaseModel):
+    job_id: int
+    status: str # queued, running, completed, failed
+    total: int = 0
+    processed: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -17,6 +17,19 @@ class Notification(NotificationBase):
     recipient_id: int
     is_read: bool
     created_at: datetime
+    kind: str = "personal" # personal, broadcast (broadcasts have negative ids)
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+class UnreadCount(BaseModel):
+    count: int
+
+# Batch acknowledgement: notification ids (broadcasts negative) and/or everything up to a page cursor
+class NotificationAck(BaseModel):
+    ids: List[int] = []
+    up_to_cursor: Optional[str] = None
+
+class NotificationAckResult(BaseModel):
+    marked_read: int
+    unread_count: int
@@ -0,0 +1,9 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+class TalentSearchResult(BaseModel):
+    student_id: int
+    full_name: Optional[str] = None
+    email: str
+    score: int # Sum of term frequencies of the matched terms
+    matched_terms: List[str] = []
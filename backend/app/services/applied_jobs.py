@@ -0,0 +1,80 @@
+import threading
+import zlib
+from array import array
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+
+APPLIED_SET_CACHE_SIZE = 20_000
+
+class AppliedJobSet:
+    """
+    Sorted int32 array of the job ids a student applied to: 4 bytes per application,
+    O(log n) membership via bisect.
+    """
+
+    __slots__ = ("job_ids",)
+
+    def __init__(self, job_ids):
+        self.job_ids = array("i", sorted(job_ids))
+
+    def __contains__(self, job_id: int) -> bool:
+        i = bisect_left(self.job_ids, job_id)
+        return i < len(self.job_ids) and self.job_ids[i] == job_id
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def add(self, job_id: int) -> None:
+        if job_id not in self:
+            insort(self.job_ids, job_id)
+
+    def checksum(self) -> int:
+        return zlib.crc32(self.job_ids.tobytes())
+
+# Per-student applied sets (in-process LRU), loaded on first use
+_applied: "OrderedDict[int, AppliedJobSet]" = OrderedDict()
+# Bumped by record_application: a load that overlapped one may predate it and is redone
+_generation = 0
+_applied_lock = threading.Lock()
+LOAD_ATTEMPTS = 3
+
+def _load_applied_jobs(db: Session, student_id: int) -> AppliedJobSet:
+    # Served by ix_applications_student_job (index-only)
+    rows = db.query(Application.job_id).filter(Application.student_id == student_id)
+    return AppliedJobSet(job_id for (job_id,) in rows)
+
+def get_applied_jobs(db: Session, student_id: int) -> AppliedJobSet:
+    for _ in range(LOAD_ATTEMPTS):
+        with _applied_lock:
+            applied = _applied.get(student_id)
+            if applied is not None:
+                _applied.move_to_end(student_id)
+                return applied
+            generation = _generation
+
+        applied = _load_applied_jobs(db, student_id)
+        with _applied_lock:
+            if _generation != generation:
+                continue # an application was committed meanwhile; each query sees the latest commit
+            _applied[student_id] = applied
+            _applied.move_to_end(student_id)
+            while len(_applied) > APPLIED_SET_CACHE_SIZE:
+                _applied.popitem(last=False)
+            return applied
+    # Still racing writers: answer from the database without caching
+    return _load_applied_jobs(db, student_id)
+
+def record_application(student_id: int, job_id: int) -> None:
+    """
+    Add a new application to the student's set, if loaded. Call after commit.
+    """
+    global _generation
+    with _applied_lock:
+        _generation += 1
+        applied = _applied.get(student_id)
+        if applied is not None:
+            applied.add(job_id)
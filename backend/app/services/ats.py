@@ -0,0 +1,126 @@
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.application import Application, ScoreStatus
+from app.models.job import Job
+from app.models.cv_text import CVText, CVTextStatus
+from app.services.keyword_matcher import get_matcher
+from app.utils.text import is_keyword, normalize_text, tokenize
+
+# Weight of a keyword by the job field it came from. A keyword found in several
+# fields keeps the highest weight.
+REQUIRED_SKILL_WEIGHT = 3.0
+TOOL_WEIGHT = 2.0
+PREFERRED_SKILL_WEIGHT = 1.5
+REQUIREMENT_WEIGHT = 1.0
+
+def _add_keyword(keywords: Dict[str, float], phrase: str, weight: float) -> None:
+    tokens = [t for t in tokenize(normalize_text(phrase)) if is_keyword(t)]
+    if not tokens:
+        return
+    keyword = " ".join(tokens)
+    keywords[keyword] = max(keywords.get(keyword, 0.0), weight)
+
+def build_job_keywords(job: Job) -> Dict[str, float]:
+    """
+    Normalized, weighted keyword set of a job, persisted on Job.keywords.
+    Skill and tool entries are kept as (possibly multi-word) phrases,
+    the free-text requirements are split into single words with stopwords dropped.
+    """
+    keywords: Dict[str, float] = {}
+    for token in tokenize(normalize_text(job.requirements or "")):
+        if is_keyword(token):
+            keywords[token] = max(keywords.get(token, 0.0), REQUIREMENT_WEIGHT)
+
+    sources = (
+        (job.preferred_skills, PREFERRED_SKILL_WEIGHT),
+        (job.tools, TOOL_WEIGHT),
+        (job.required_skills, REQUIRED_SKILL_WEIGHT),
+    )
+    for phrases, weight in sources:
+        for phrase in phrases or []:
+            _add_keyword(keywords, phrase, weight)
+
+    return keywords
+
+def get_job_keywords(job: Job) -> Dict[str, float]:
+    """
+    Keyword index of a job, computed and attached on the fly for jobs created before it existed.
+    """
+    if job.keywords is None:
+        job.keywords = build_job_keywords(job)
+    return job.keywords
+
+def score_hits(keywords: Dict[str, float], hits: Dict[str, int]) -> float:
+    """
+    Weighted share of the job keywords found in a CV, as a 0-100 score.
+    """
+    if not keywords:
+        return 50.0 # Default if no keywords found
+
+    total_weight = sum(keywords.values())
+    matched_weight = sum(weight for keyword, weight in keywords.items() if hits.get(keyword))
+    score = (matched_weight / total_weight) * 100
+
+    # Boost score slightly, clamp to 100
+    return round(min(score * 1.2, 100.0), 1)
+
+def count_keyword_hits(
+    job_id: int, keywords: Dict[str, float], text: str, term_counts: Dict[str, int]
+) -> Dict[str, int]:
+    """
+    Per-keyword hit counts in a CV. Single words are read off the CV's stored term counts;
+    the text is only scanned (with the job's compiled phrase matcher) when every word of
+    some phrase occurs in it.
+    """
+    hits = {keyword: term_counts[keyword] for keyword in keywords if " " not in keyword and term_counts.get(keyword)}
+    phrases: List[str] = [keyword for keyword in keywords if " " in keyword]
+    if any(all(term_counts.get(word) for word in phrase.split()) for phrase in phrases):
+        hits.update(get_matcher(job_id, phrases).count(tokenize(text)))
+    return hits
+
+def calculate_ats_score(job: Job, cv_text: Optional[CVText]) -> float:
+    """
+    ATS score of a stored CV against a job's precomputed keyword index.
+    """
+    if cv_text is None:
+        return 0.0
+    try:
+        keywords = get_job_keywords(job)
+        hits = count_keyword_hits(job.id, keywords, cv_text.text, cv_text.term_counts or {})
+        return score_hits(keywords, hits)
+    except Exception as e:
+        print(f"ATS Calculation Error: {e}")
+        return 0.0
+
+def score_application(job: Job, cv_text: Optional[CVText]) -> Tuple[float, ScoreStatus]:
+    """
+    Score plus scoring state for an application. Instead of a silent 0.0, a CV whose text
+    is not extracted yet is "pending" and one that could not be extracted is "failed".
+    """
+    if cv_text is None or cv_text.status == CVTextStatus.PENDING:
+        return 0.0, ScoreStatus.PENDING
+    if cv_text.status == CVTextStatus.FAILED:
+        return 0.0, ScoreStatus.FAILED
+    return calculate_ats_score(job, cv_text), ScoreStatus.SCORED
+
+def rescore_unscored_applications(db: Session, cv_text: CVText) -> int:
+    """
+    Score a student's pending/failed applications once their CV text is available.
+    Does not commit; the caller owns the transaction.
+    """
+    applications = (
+        db.query(Application)
+        .options(joinedload(Application.job))
+        .filter(
+            Application.student_id == cv_text.user_id,
+            Application.ats_status != ScoreStatus.SCORED.value,
+        )
+        .all()
+    )
+    for application in applications:
+        score, score_status = score_application(application.job, cv_text)
+        application.ats_score = score
+        application.ats_status = score_status.value
+    return len(applications)
@@ -0,0 +1,132 @@
+import asyncio
+import io
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from app.core.config import settings
+from app.utils.text import normalize_text
+
+# Extra time the parent waits on top of the worker-side alarm before killing the pool
+KILL_GRACE_SECONDS = 5
+
+class CVExtractionError(Exception):
+    """Raised when a CV could not be turned into text (bad PDF, timeout, memory cap)."""
+
+class _WorkerTimeout(Exception):
+    pass
+
+def _init_worker(max_memory_mb: int) -> None:
+    # Cap the address space of the worker so a hostile PDF hits MemoryError
+    # instead of taking the host down. Not available on Windows.
+    try:
+        import resource
+        limit = max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        print(f"CV worker memory limit not applied: {e}")
+
+def _raise_timeout(signum, frame):
+    raise _WorkerTimeout()
+
+def _extract_in_worker(contents: bytes, max_pages: int, timeout: int) -> str:
+    """
+    Runs inside the pool process. pdfminer is pure Python, so a SIGALRM interrupts
+    it promptly; the parent-side kill is only a backstop.
+    """
+    import signal
+    from pdfminer.high_level import extract_text
+
+    has_alarm = hasattr(signal, "setitimer")
+    if has_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return normalize_text(extract_text(io.BytesIO(contents), maxpages=max_pages))
+    except _WorkerTimeout:
+        raise CVExtractionError(f"CV text extraction timed out after {timeout}s")
+    except MemoryError:
+        raise CVExtractionError(f"CV text extraction exceeded {settings.CV_EXTRACTION_MAX_MEMORY_MB}MB")
+    finally:
+        if has_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a threaded server process is not safe
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.CV_EXTRACTION_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(settings.CV_EXTRACTION_MAX_MEMORY_MB,),
+            )
+        return _pool
+
+def _reset_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Kill a pool whose worker is stuck or died. Tasks still running in it fail
+    and are reported as failed extractions.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _submit(contents: bytes) -> "tuple[ProcessPoolExecutor, Future]":
+    args = (contents, settings.CV_EXTRACTION_MAX_PAGES, settings.CV_EXTRACTION_TIMEOUT_SECONDS)
+    pool = _get_pool()
+    try:
+        return pool, pool.submit(_extract_in_worker, *args)
+    except BrokenProcessPool:
+        # A previous worker died; start a fresh pool once
+        _reset_pool(pool)
+        pool = _get_pool()
+        return pool, pool.submit(_extract_in_worker, *args)
+
+def _unwrap(pool: ProcessPoolExecutor, exc: BaseException) -> CVExtractionError:
+    if isinstance(exc, CVExtractionError):
+        return exc
+    if isinstance(exc, BrokenProcessPool):
+        # Worker was killed, most likely by the memory cap
+        _reset_pool(pool)
+        return CVExtractionError("CV text extraction worker crashed")
+    return CVExtractionError(f"Could not read CV: {exc}")
+
+def extract_cv_text(contents: bytes) -> str:
+    """
+    Extract normalized CV text in the dedicated process pool (blocking, for sync handlers).
+    """
+    pool, future = _submit(contents)
+    try:
+        return future.result(timeout=settings.CV_EXTRACTION_TIMEOUT_SECONDS + KILL_GRACE_SECONDS)
+    except FutureTimeoutError:
+        _reset_pool(pool)
+        raise CVExtractionError(f"CV text extraction timed out after {settings.CV_EXTRACTION_TIMEOUT_SECONDS}s")
+    except Exception as e:
+        raise _unwrap(pool, e)
+
+async def extract_cv_text_async(contents: bytes) -> str:
+    """
+    Same as extract_cv_text, awaited without holding the event loop or a threadpool slot.
+    """
+    pool, future = _submit(contents)
+    try:
+        return await asyncio.wait_for(
+            asyncio.wrap_future(future),
+            timeout=settings.CV_EXTRACTION_TIMEOUT_SECONDS + KILL_GRACE_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        _reset_pool(pool)
+        raise CVExtractionError(f"CV text extraction timed out after {settings.CV_EXTRACTION_TIMEOUT_SECONDS}s")
+    except Exception as e:
+        raise _unwrap(pool, e)
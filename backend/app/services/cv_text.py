@@ -0,0 +1,148 @@
+import hashlib
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.cv_text import CVText, CVTextStatus
+from app.models.user import User
+from app.services.ats import rescore_unscored_applications
+from app.services.cv_extraction import KILL_GRACE_SECONDS, extract_cv_text
+from app.services.outbox import add_event
+from app.services.recommendations import refresh_student_vector
+from app.services.talent_search import reindex_student
+from app.utils.text import tokenize
+
+UPLOAD_DIR = Path("uploads")
+
+def _queue_extraction(db: Session, cv_text: CVText, delay_seconds: float = 0, attempt: int = 1) -> None:
+    add_event(
+        db,
+        "cv_text_requested",
+        {"user_id": cv_text.user_id, "content_hash": cv_text.content_hash, "attempt": attempt},
+        delay_seconds,
+    )
+
+def begin_cv_text(db: Session, user: User, contents: bytes) -> Optional[CVText]:
+    """
+    Mark the user's CV text as pending extraction for a newly uploaded file.
+    Returns None when the same file was already extracted, so pdfminer can be skipped.
+    The upload extracts the text right away; a background extraction is queued as well and
+    only runs if the row is still pending by then (the request died half way).
+    Does not commit; the caller owns the transaction.
+    """
+    content_hash = hashlib.sha256(contents).hexdigest()
+    cv_text = db.query(CVText).filter(CVText.user_id == user.id).first()
+    if cv_text and cv_text.content_hash == content_hash and cv_text.status == CVTextStatus.READY:
+        return None
+
+    if not cv_text:
+        cv_text = CVText(user_id=user.id)
+    # Never keep scoring against the text of a CV that has been replaced
+    cv_text.content_hash = content_hash
+    cv_text.text = ""
+    cv_text.term_counts = {}
+    cv_text.token_count = 0
+    cv_text.status = CVTextStatus.PENDING.value
+    cv_text.error = None
+    db.add(cv_text)
+    _queue_extraction(db, cv_text, settings.CV_EXTRACTION_TIMEOUT_SECONDS + KILL_GRACE_SECONDS)
+    return cv_text
+
+def complete_cv_text(cv_text: CVText, text: str) -> None:
+    tokens = tokenize(text)
+    cv_text.text = text
+    cv_text.term_counts = dict(Counter(tokens))
+    cv_text.token_count = len(tokens)
+    cv_text.status = CVTextStatus.READY.value
+    cv_text.error = None
+
+def fail_cv_text(cv_text: CVText, error: str) -> None:
+    print(f"CV Text Extraction Error: {error}")
+    cv_text.status = CVTextStatus.FAILED.value
+    cv_text.error = error
+
+def apply_cv_text(db: Session, cv_text: CVText) -> None:
+    """
+    Re-score the student's unscored applications and refresh their search postings and
+    recommendation vector once the CV text is ready or failed. Commits.
+    """
+    rescore_unscored_applications(db, cv_text)
+    reindex_student(db, cv_text.user_id)
+    db.commit()
+    refresh_student_vector(db, cv_text.user_id)
+
+def get_cv_text(db: Session, user: User) -> Optional[CVText]:
+    """
+    Stored CV text for a user.
+    CVs uploaded before text extraction existed get a pending row and a queued background
+    extraction; applications are re-scored when it finishes. Does not commit.
+    """
+    cv_text = db.query(CVText).filter(CVText.user_id == user.id).first()
+    if cv_text or not user.cv_filename:
+        return cv_text
+
+    # Hashed once the file has been fetched
+    cv_text = CVText(user_id=user.id, content_hash="", text="", status=CVTextStatus.PENDING.value)
+    db.add(cv_text)
+    _queue_extraction(db, cv_text)
+    return cv_text
+
+def load_cv_file(filename: str) -> bytes:
+    """
+    An uploaded CV from Supabase storage, or from the local upload dir for CVs stored before it.
+    """
+    try:
+        from app.utils.supabase import supabase
+        return supabase.storage.from_("cvs").download(filename)
+    except Exception as e:
+        cv_path = UPLOAD_DIR / filename
+        if cv_path.exists():
+            return cv_path.read_bytes()
+        raise FileNotFoundError(f"CV file {filename} not found in storage: {e}")
+
+def _pending_cv_text(db: Session, user_id: int, content_hash: str) -> Optional[CVText]:
+    cv_text = db.query(CVText).filter(CVText.user_id == user_id).first()
+    if cv_text is None or cv_text.status != CVTextStatus.PENDING or cv_text.content_hash != content_hash:
+        return None
+    return cv_text
+
+def queue_cv_text_retry(db: Session, user_id: int, content_hash: str, attempt: int) -> bool:
+    """
+    Before a background extraction starts: queue a delayed retry that takes over if the process
+    dies before it finishes (a no-op once the text is ready). After OUTBOX_MAX_ATTEMPTS attempts
+    the CV is marked failed instead. Returns whether to go ahead with the extraction. Commits.
+    """
+    cv_text = _pending_cv_text(db, user_id, content_hash)
+    if cv_text is None:
+        return False
+    if attempt > settings.OUTBOX_MAX_ATTEMPTS:
+        fail_cv_text(cv_text, f"Extraction did not finish after {settings.OUTBOX_MAX_ATTEMPTS} attempts")
+        apply_cv_text(db, cv_text)
+        return False
+    _queue_extraction(db, cv_text, settings.CV_EXTRACTION_TIMEOUT_SECONDS + KILL_GRACE_SECONDS, attempt + 1)
+    db.commit()
+    return True
+
+def extract_pending_cv_text(db: Session, user_id: int, content_hash: str) -> Optional[CVText]:
+    """
+    Background extraction of a pending CV text. Returns None when there is nothing to do
+    (already extracted, or replaced by a newer upload). Any error ends in "failed" with its
+    reason, so the CV never stays pending. Does not commit.
+    """
+    cv_text = _pending_cv_text(db, user_id, content_hash)
+    if cv_text is None:
+        return None
+
+    user = db.get(User, user_id)
+    try:
+        if not user or not user.cv_filename:
+            raise FileNotFoundError("No CV uploaded")
+        contents = load_cv_file(user.cv_filename)
+        cv_text.content_hash = hashlib.sha256(contents).hexdigest()
+        complete_cv_text(cv_text, extract_cv_text(contents))
+    except Exception as e:
+        fail_cv_text(cv_text, str(e))
+    return cv_text
@@ -0,0 +1,60 @@
+import asyncio
+from typing import List
+
+from sqlalchemy import func, update
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.job import Job, JobStatus
+from app.services.job_cache import job_list_cache
+from app.services.job_facets import FACETS, open_job_facets
+from app.services.outbox import add_event
+from app.services.recommendations import job_index
+
+def close_expired_jobs() -> List[int]:
+    """
+    Close every open job past its deadline with one UPDATE ... RETURNING
+    (served by ix_jobs_open_deadline) and queue one "jobs_closed" outbox event in the
+    same transaction, then sync the in-memory job caches.
+    Returns the ids of the jobs closed.
+    """
+    db = SessionLocal()
+    try:
+        closed = db.execute(
+            update(Job)
+            .where(Job.status == JobStatus.OPEN, Job.deadline.isnot(None), Job.deadline <= func.now())
+            .values(status=JobStatus.CLOSED.value)
+            .returning(Job.id, *[getattr(Job, facet) for facet in FACETS])
+            .execution_options(synchronize_session=False)
+        ).all()
+        if closed:
+            job_ids = [row.id for row in closed]
+            add_event(db, "jobs_closed", {"job_ids": job_ids, "count": len(job_ids)})
+        db.commit()
+    finally:
+        db.close()
+
+    if not closed:
+        return []
+    job_index.remove(job_ids)
+    job_list_cache.bump_version()
+    for row in closed:
+        # RETURNING gives the new status; the job counted as open before
+        before = {facet: getattr(row, facet) for facet in FACETS}
+        before["status"] = JobStatus.OPEN.value
+        open_job_facets.apply(before, None)
+    return job_ids
+
+async def run_deadline_sweeper() -> None:
+    """
+    Lifespan task: sweep every JOB_DEADLINE_SWEEP_SECONDS.
+    """
+    while True:
+        try:
+            job_ids = await run_in_threadpool(close_expired_jobs)
+            if job_ids:
+                print(f"Deadline sweep closed {len(job_ids)} jobs")
+        except Exception as e:
+            print(f"Deadline Sweep Error: {e}")
+        await asyncio.sleep(settings.JOB_DEADLINE_SWEEP_SECONDS)
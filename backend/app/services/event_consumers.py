@@ -0,0 +1,108 @@
+"""
+Outbox consumers. Imported once at startup so the registrations take effect.
+"""
+import asyncio
+from typing import Dict, List, Set
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.manager import manager
+from app.db.session import SessionLocal
+from app.models.user import User, UserRole
+from app.services.cv_text import apply_cv_text, extract_pending_cv_text, queue_cv_text_retry
+from app.services.outbox import register_consumer
+from app.services.unread_counts import count_unread, get_unread_counts, record_broadcast
+from app.utils.email import send_application_status_email
+
+@register_consumer("job_posted", "jobs_imported", "jobs_closed")
+async def push_to_students(event: str, data: dict) -> None:
+    await manager.broadcast_to_role({"event": event, "data": data}, UserRole.STUDENT.value)
+
+@register_consumer("application_submitted")
+async def push_to_job_admin(event: str, data: dict) -> None:
+    await manager.send_to_users({"event": event, "data": data}, [data.get("admin_id")])
+
+@register_consumer("status_updated")
+async def push_to_applicant(event: str, data: dict) -> None:
+    # The student, and the job's admin (keeps their other tabs in sync)
+    await manager.send_to_users({"event": event, "data": data}, {data["student_id"], data.get("admin_id")})
+
+@register_consumer("status_updated")
+def email_status_update(event: str, data: dict) -> None:
+    db = SessionLocal()
+    try:
+        student = db.get(User, data["student_id"])
+    finally:
+        db.close()
+    if student:
+        send_application_status_email(student.email, student.full_name, data["job_title"], data["status"])
+
+# Background CV extractions in flight, held so they are not garbage collected
+_extractions: Set[asyncio.Task] = set()
+
+def _start_cv_text_extraction(data: dict) -> bool:
+    db = SessionLocal()
+    try:
+        return queue_cv_text_retry(db, data["user_id"], data["content_hash"], data.get("attempt", 1))
+    finally:
+        db.close()
+
+def _extract_cv_text(data: dict) -> None:
+    db = SessionLocal()
+    try:
+        cv_text = extract_pending_cv_text(db, data["user_id"], data["content_hash"])
+        if cv_text is not None:
+            apply_cv_text(db, cv_text)
+    finally:
+        db.close()
+
+def _extraction_done(task: asyncio.Task) -> None:
+    _extractions.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        # The queued retry picks it up again
+        print(f"CV Text Extraction Error: {task.exception()}")
+
+@register_consumer("cv_text_requested")
+async def extract_cv_text_in_background(event: str, data: dict) -> None:
+    """
+    Hands the extraction (up to the extraction timeout) to a task and returns, so it does not
+    hold up the other outbox events.
+    """
+    if not await run_in_threadpool(_start_cv_text_extraction, data):
+        return
+    task = asyncio.create_task(run_in_threadpool(_extract_cv_text, data))
+    _extractions.add(task)
+    task.add_done_callback(_extraction_done)
+
+def _unread_counts(data: dict, user_ids: List[int]) -> Dict[int, int]:
+    db = SessionLocal()
+    try:
+        users = db.query(User).filter(User.id.in_(user_ids)).all()
+        if "user_ids" in data:
+            # From the database: this can run before the request that queued the event has
+            # dropped the users' cached counts
+            return count_unread(db, users)
+        # Likewise the broadcast may not be recorded yet (a no-op if it is)
+        if "broadcast_id" in data:
+            record_broadcast(data["audience"], data["broadcast_id"])
+        return get_unread_counts(db, users)
+    finally:
+        db.close()
+
+@register_consumer("unread_count_changed")
+async def push_unread_counts(event: str, data: dict) -> None:
+    """
+    Push fresh badge counts to the affected users that are connected:
+    data is {"user_ids": [...]} or {"audience": role or None, "broadcast_id": id} for a broadcast.
+    """
+    if "user_ids" in data:
+        recipients = [user_id for user_id in data["user_ids"] if user_id in manager.active_connections]
+    elif data["audience"] is not None:
+        recipients = list(manager.users_by_role.get(data["audience"], ()))
+    else:
+        recipients = list(manager.active_connections)
+    if not recipients:
+        return
+    counts = await run_in_threadpool(_unread_counts, data, recipients)
+    for user_id, count in counts.items():
+        await manager.send_personal_message({"event": "unread_count", "data": {"count": count}}, user_id)
@@ -0,0 +1,85 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, NamedTuple, Optional
+
+from app.core.config import settings
+
+class CachedJobPage(NamedTuple):
+    jobs: List[dict] # serialized job_schemas.Job payloads
+    next_cursor: Optional[str]
+
+class JobListCache:
+    """
+    Read-through cache of student job listing pages (open jobs only, no per-user data).
+    Keyed by filters, sort and page; every entry belongs to a "jobs version" that
+    create/update bump, so a write invalidates all pages at once.
+    LRU eviction keeps the serialized size under JOB_CACHE_MAX_BYTES.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict() # key -> (page, size)
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def bump_version(self) -> None:
+        """
+        Invalidate every cached page. Call after a job write is committed.
+        """
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def get(self, key: Hashable) -> Optional[CachedJobPage]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, version: int, page: CachedJobPage) -> None:
+        """
+        Store a page built from data read at `version` (read it before querying).
+        Pages read before a concurrent write are dropped instead of cached.
+        """
+        size = len(json.dumps(page.jobs, default=str)) + len(page.next_cursor or "")
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if version != self._version:
+                return
+            previous = self._entries.pop(key, None)
+            if previous:
+                self._bytes -= previous[1]
+            self._entries[key] = (page, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+job_list_cache = JobListCache(settings.JOB_CACHE_MAX_BYTES)
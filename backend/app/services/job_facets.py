@@ -0,0 +1,93 @@
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JobStatus
+
+FACETS = ("job_type", "department", "location", "status")
+FacetValues = Dict[str, Optional[str]]
+
+def facet_values(job: Job) -> Optional[FacetValues]:
+    """
+    A job's facet values when it counts towards the open-job facets, else None.
+    """
+    if job.status != JobStatus.OPEN:
+        return None
+    return {facet: getattr(job, facet) for facet in FACETS}
+
+def count_facets(db: Session, conditions: List) -> dict:
+    """
+    Per-value counts of every facet over the jobs matching `conditions`, in one
+    GROUPING SETS query (one grouping set per facet, plus () for the total).
+    """
+    columns = [getattr(Job, facet) for facet in FACETS]
+    statement = (
+        select(*columns, func.grouping(*columns).label("grouping"), func.count().label("count"))
+        .where(*conditions)
+        .group_by(func.grouping_sets(*[tuple_(column) for column in columns], text("()")))
+    )
+
+    all_bits = (1 << len(FACETS)) - 1
+    counts = {facet: {} for facet in FACETS}
+    total = 0
+    for row in db.execute(statement):
+        if row.grouping == all_bits:
+            total = row.count
+            continue
+        for i, facet in enumerate(FACETS):
+            # grouping() clears the bit of the column the row is grouped by (leftmost = highest bit)
+            if row.grouping == all_bits & ~(1 << (len(FACETS) - 1 - i)):
+                if row[i] is not None:
+                    counts[facet][row[i]] = row.count
+                break
+    return {**counts, "total": total}
+
+class OpenJobFacetCounts:
+    """
+    Facet counts over all open jobs (the unfiltered student view), kept in memory.
+    Loaded once, then adjusted by create/update/close hooks instead of re-counting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._counts: Dict[str, Counter] = {facet: Counter() for facet in FACETS}
+        self._total = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, db: Session) -> None:
+        counts = count_facets(db, [Job.status == JobStatus.OPEN])
+        with self._lock:
+            self._counts = {facet: Counter(counts[facet]) for facet in FACETS}
+            self._total = counts["total"]
+            self._loaded = True
+
+    def apply(self, before: Optional[FacetValues], after: Optional[FacetValues]) -> None:
+        """
+        Move one job from its old facet values to its new ones (None = not open). Call after commit.
+        """
+        if not self._loaded or before == after:
+            return
+        with self._lock:
+            for values, delta in ((before, -1), (after, 1)):
+                if values is None:
+                    continue
+                self._total += delta
+                for facet, value in values.items():
+                    if value is None:
+                        continue
+                    self._counts[facet][value] += delta
+                    if self._counts[facet][value] <= 0:
+                        del self._counts[facet][value]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**{facet: dict(self._counts[facet]) for facet in FACETS}, "total": self._total}
+
+open_job_facets = OpenJobFacetCounts()
@@ -0,0 +1,123 @@
+import csv
+import io
+import json
+from typing import BinaryIO, Dict, Iterator, List, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.job import Job, JobStatus
+from app.schemas import job as job_schemas
+from app.services.ats import build_job_keywords
+from app.services.job_cache import job_list_cache
+from app.services.job_facets import facet_values, open_job_facets
+from app.services.recommendations import job_index
+
+IMPORT_CHUNK_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+LIST_FIELDS = ("responsibilities", "required_skills", "preferred_skills", "tools")
+
+# (line number, fields) or (line number, error message) for a row that could not be parsed
+Row = Tuple[int, Union[dict, str]]
+
+def _csv_row(record: dict) -> dict:
+    row = {key.strip(): value.strip() for key, value in record.items() if key and value and value.strip()}
+    # List cells are a JSON array or "a; b; c"
+    for field in LIST_FIELDS:
+        value = row.get(field)
+        if value is None:
+            continue
+        if value.startswith("["):
+            row[field] = json.loads(value)
+        else:
+            row[field] = [item.strip() for item in value.split(";") if item.strip()]
+    return row
+
+def _csv_rows(stream: io.TextIOWrapper) -> Iterator[Row]:
+    reader = csv.DictReader(stream)
+    for record in reader:
+        try:
+            yield reader.line_num, _csv_row(record)
+        except ValueError as e:
+            yield reader.line_num, f"Invalid list value: {e}"
+
+def _jsonl_rows(stream: io.TextIOWrapper) -> Iterator[Row]:
+    for line_num, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_num, f"Invalid JSON: {e}"
+            continue
+        yield line_num, row if isinstance(row, dict) else "Each line must be a JSON object"
+
+def iter_import_rows(file: BinaryIO, file_format: str) -> Iterator[Row]:
+    """
+    Stream rows out of an uploaded CSV or JSONL file, one line at a time.
+    """
+    stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        yield from (_csv_rows(stream) if file_format == "csv" else _jsonl_rows(stream))
+    finally:
+        stream.detach() # leave closing the upload to its owner
+
+def _insert_chunk(db: Session, chunk: List[Dict]) -> List[Job]:
+    """
+    Multi-row INSERT of validated jobs. Commits, then syncs the in-memory job indexes.
+    The returned jobs are detached before the commit, so they keep the RETURNING values
+    instead of being expired and reloaded one SELECT at a time.
+    """
+    jobs = db.scalars(insert(Job).returning(Job), chunk).all()
+    db.expunge_all() # also keeps memory flat across chunks
+    db.commit()
+    for job in jobs:
+        job_index.upsert(job)
+        open_job_facets.apply(None, facet_values(job))
+    job_list_cache.bump_version()
+    return jobs
+
+def import_jobs(db: Session, admin_id: int, rows: Iterator[Row]) -> dict:
+    """
+    Validate rows with JobCreate and insert the valid ones in chunks of IMPORT_CHUNK_SIZE
+    (each chunk is committed). Invalid rows are skipped; the first MAX_REPORTED_ERRORS are reported.
+    """
+    result = {"imported": 0, "open_jobs": 0, "skipped": 0, "errors": []}
+    chunk: List[Dict] = []
+
+    def skip(line: int, error: str) -> None:
+        result["skipped"] += 1
+        if len(result["errors"]) < MAX_REPORTED_ERRORS:
+            result["errors"].append({"line": line, "error": error})
+
+    def flush() -> None:
+        jobs = _insert_chunk(db, chunk)
+        result["imported"] += len(jobs)
+        result["open_jobs"] += sum(1 for job in jobs if job.status == JobStatus.OPEN)
+        chunk.clear()
+
+    line = 0
+    try:
+        for line, row in rows:
+            if isinstance(row, str):
+                skip(line, row)
+                continue
+            try:
+                job_in = job_schemas.JobCreate(**row)
+            except ValidationError as e:
+                skip(line, "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+                continue
+
+            values = {**job_in.dict(), "admin_id": admin_id}
+            values["keywords"] = build_job_keywords(Job(**values))
+            chunk.append(values)
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                flush()
+    except (csv.Error, UnicodeDecodeError) as e:
+        # Unreadable file: keep what was imported so far and stop
+        skip(line + 1, f"Could not read file: {e}")
+
+    if chunk:
+        flush()
+    return result
@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Iterable, List, Tuple
+
+from app.utils.text import normalize_text, tokenize
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over word tokens.
+    Keywords (single words or phrases) are compiled once; a CV is then scanned in a
+    single pass over its tokens, whatever the number of keywords. Matching on tokens
+    instead of characters gives word boundaries for free ("sql" does not hit "nosql").
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for keyword in keywords:
+            tokens = tokenize(normalize_text(keyword))
+            if not tokens:
+                continue
+            node = 0
+            for token in tokens:
+                nxt = self._goto[node].get(token)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][token] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(len(self.keywords))
+            self.keywords.append(keyword)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit matches of the longest proper suffix, e.g. "learning" inside "machine learning"
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def count(self, tokens: Iterable[str]) -> Dict[str, int]:
+        """
+        Per-keyword hit counts over an already tokenized text. Keywords without hits are omitted.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = [0] * len(self.keywords)
+        node = 0
+        for token in tokens:
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            for idx in out[node]:
+                hits[idx] += 1
+        return {self.keywords[i]: n for i, n in enumerate(hits) if n}
+
+    def count_text(self, text: str) -> Dict[str, int]:
+        return self.count(tokenize(normalize_text(text)))
+
+# Compiled matchers per job, rebuilt when the job's keyword set changes
+_MATCHER_CACHE_SIZE = 256
+_matchers: "OrderedDict[int, Tuple[frozenset, KeywordMatcher]]" = OrderedDict()
+_matchers_lock = threading.Lock()
+
+def get_matcher(job_id: int, keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    Matcher compiled for a job's keyword set, cached (LRU) across applications.
+    """
+    signature = frozenset(keywords)
+    with _matchers_lock:
+        cached = _matchers.get(job_id)
+        if cached and cached[0] == signature:
+            _matchers.move_to_end(job_id)
+            return cached[1]
+
+    matcher = KeywordMatcher(signature)
+    with _matchers_lock:
+        _matchers[job_id] = (signature, matcher)
+        _matchers.move_to_end(job_id)
+        while len(_matchers) > _MATCHER_CACHE_SIZE:
+            _matchers.popitem(last=False)
+    return matcher
@@ -0,0 +1,183 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+
+# notification is range-partitioned by month on created_at (UTC): notification_YYYY_MM,
+# plus notification_default for rows outside every month partition
+PARTITION_NAME = re.compile(r"^notification_(\d{4})_(\d{2})$")
+DEFAULT_PARTITION = "notification_default"
+COLUMNS = "id, recipient_id, message, type, is_read, created_at"
+
+def _add_months(month: datetime, months: int) -> datetime:
+    year, month_index = divmod(month.month - 1 + months, 12)
+    return month.replace(year=month.year + year, month=month_index + 1)
+
+def month_start(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def partition_name(month: datetime) -> str:
+    return f"notification_{month:%Y_%m}"
+
+def list_partitions(db: Session) -> List[datetime]:
+    """
+    Start of the month of every monthly partition, oldest first.
+    """
+    names = db.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'notification'::regclass"
+    )).scalars()
+    months = []
+    for name in names:
+        match = PARTITION_NAME.match(name)
+        if match:
+            months.append(datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc))
+    return sorted(months)
+
+def create_partition(db: Session, month: datetime) -> None:
+    """
+    Create the partition for `month`, moving any of its rows out of the default partition
+    first (Postgres refuses to attach a range the default partition already holds). Does not commit.
+    """
+    lower, upper = month, _add_months(month, 1)
+    in_range = f"created_at >= '{lower.isoformat()}' AND created_at < '{upper.isoformat()}'"
+    db.execute(text(
+        f"CREATE TEMP TABLE notification_moving ON COMMIT DROP AS "
+        f"SELECT {COLUMNS} FROM {DEFAULT_PARTITION} WHERE {in_range}"
+    ))
+    db.execute(text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"))
+    db.execute(text(
+        f"CREATE TABLE {partition_name(month)} PARTITION OF notification "
+        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    ))
+    db.execute(text(f"INSERT INTO notification ({COLUMNS}) SELECT {COLUMNS} FROM notification_moving"))
+    db.execute(text("DROP TABLE notification_moving"))
+
+def ensure_partitions(db: Session, months_ahead: Optional[int] = None) -> List[str]:
+    """
+    Create the partitions for the current month and the next `months_ahead` months
+    (NOTIFICATION_PARTITIONS_AHEAD by default). Commits each one. Returns the names created.
+    """
+    if months_ahead is None:
+        months_ahead = settings.NOTIFICATION_PARTITIONS_AHEAD
+    existing = set(list_partitions(db))
+    current = month_start(datetime.now(timezone.utc))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = _add_months(current, offset)
+        if month not in existing:
+            create_partition(db, month)
+            db.commit()
+            created.append(partition_name(month))
+    return created
+
+def ensure_partitions_on_startup() -> None:
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db)
+        if created:
+            print(f"Created notification partitions: {', '.join(created)}")
+    except Exception as e:
+        # Another worker may be creating the same partition; rows fall back to the default partition
+        db.rollback()
+        print(f"Notification Partition Error: {e}")
+    finally:
+        db.close()
+
+def apply_retention(db: Session, days: Optional[int] = None, mode: Optional[str] = None, dry_run: bool = False) -> List[dict]:
+    """
+    Remove read notifications from every monthly partition that ends more than `days` ago,
+    one partition (and one commit) at a time. In "archive" mode they are copied to
+    notification_archive first. A partition with no unread rows left is detached and dropped;
+    otherwise its read rows are deleted and the unread ones kept.
+    Returns what was done (or would be, with dry_run) per partition.
+    """
+    days = settings.NOTIFICATION_RETENTION_DAYS if days is None else days
+    mode = mode or settings.NOTIFICATION_RETENTION_MODE
+    if mode not in ("delete", "archive"):
+        raise ValueError(f"Unknown retention mode: {mode}")
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+
+    report = []
+    for month in list_partitions(db):
+        if _add_months(month, 1) > cutoff:
+            break
+        name = partition_name(month)
+        read, unread = db.execute(text(
+            f"SELECT count(*) FILTER (WHERE is_read), count(*) FILTER (WHERE is_read IS NOT TRUE) FROM {name}"
+        )).one()
+        action = "dropped" if unread == 0 else "compacted"
+        report.append({"partition": name, "read": read, "unread_kept": unread, "action": action})
+        if dry_run or (read == 0 and unread > 0):
+            continue
+        if mode == "archive" and read:
+            db.execute(text(
+                f"INSERT INTO notification_archive ({COLUMNS}) SELECT {COLUMNS} FROM {name} WHERE is_read"
+            ))
+        if action == "dropped":
+            db.execute(text(f"ALTER TABLE notification DETACH PARTITION {name}"))
+            db.execute(text(f"DROP TABLE {name}"))
+        else:
+            db.execute(text(f"DELETE FROM {name} WHERE is_read"))
+        db.commit()
+    return report
+
+def compact(connection: Connection, tables: List[str]) -> None:
+    """
+    Reclaim the space left by deleted rows: VACUUM (ANALYZE) then REINDEX CONCURRENTLY
+    (vacuum does not shrink indexes). Needs an AUTOCOMMIT connection.
+    """
+    for table in tables:
+        connection.exec_driver_sql(f"VACUUM (ANALYZE) {table}")
+        connection.exec_driver_sql(f"REINDEX TABLE CONCURRENTLY {table}")
+
+def bloat_report(db: Session) -> List[dict]:
+    """
+    Size and dead-tuple estimate for notification (each partition), notification_archive and their indexes.
+    Index leaf density comes from pgstattuple when the extension is installed.
+    """
+    has_pgstattuple = db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pgstattuple'")).first() is not None
+    tables = db.execute(text("""
+        SELECT c.oid, c.relname, pg_relation_size(c.oid) AS bytes,
+               coalesce(s.n_live_tup, 0) AS live, coalesce(s.n_dead_tup, 0) AS dead
+        FROM pg_class c
+        LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+        WHERE c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'notification'::regclass)
+           OR c.relname = 'notification_archive'
+        ORDER BY c.relname
+    """)).all()
+    report = []
+    for table in tables:
+        total = table.live + table.dead
+        report.append({
+            "relation": table.relname,
+            "bytes": table.bytes,
+            "live": table.live,
+            "dead": table.dead,
+            "bloat_pct": round(100 * table.dead / total, 1) if total else 0.0,
+        })
+        indexes = db.execute(text(
+            "SELECT c.relname, pg_relation_size(i.indexrelid) AS bytes "
+            "FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = :oid ORDER BY c.relname"
+        ), {"oid": table.oid}).all()
+        for index in indexes:
+            density = None
+            if has_pgstattuple and index.bytes:
+                density = db.execute(
+                    text("SELECT avg_leaf_density FROM pgstatindex(:name)"), {"name": index.relname}
+                ).scalar()
+            report.append({
+                "relation": f"  {index.relname}",
+                "bytes": index.bytes,
+                "live": None,
+                "dead": None,
+                # Freshly built btree leaves are ~90% full
+                "bloat_pct": None if density is None else round(max(90.0 - density, 0.0), 1),
+            })
+    return report
@@ -0,0 +1,242 @@
+import heapq
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.broadcast_notification import BroadcastNotification, NotificationCursor
+from app.models.notification import Notification
+from app.models.user import User
+from app.schemas import notification as notification_schemas
+from app.services.outbox import add_event
+from app.utils.pagination import encode_cursor
+
+def create_broadcast(db: Session, message: str, type: str = "info", audience: Optional[str] = None) -> BroadcastNotification:
+    """
+    One row for everyone in the audience (a role, or None for all users); fanned out on read.
+    Does not commit; call unread_counts.record_broadcast after committing.
+    """
+    broadcast = BroadcastNotification(message=message, type=type, audience=audience)
+    db.add(broadcast)
+    db.flush()
+    add_event(db, "unread_count_changed", {"audience": audience, "broadcast_id": broadcast.id})
+    return broadcast
+
+def _visible_to(user: User, joined: int = 0):
+    return and_(
+        or_(BroadcastNotification.audience.is_(None), BroadcastNotification.audience == user.role),
+        BroadcastNotification.id > joined,
+    )
+
+def get_broadcast(db: Session, user: User, broadcast_id: int) -> Optional[BroadcastNotification]:
+    joined, _ = get_broadcast_window(db, user)
+    return (
+        db.query(BroadcastNotification)
+        .filter(BroadcastNotification.id == broadcast_id, _visible_to(user, joined))
+        .first()
+    )
+
+def get_broadcast_window(db: Session, user: User) -> Tuple[int, int]:
+    """
+    (joined, read cursor): the user sees broadcasts after `joined` and has read those up to the cursor.
+    A user without a cursor (created outside registration, e.g. by the seed scripts) gets one
+    at the latest broadcast, like a new user.
+    """
+    window = (
+        db.query(NotificationCursor.joined_broadcast_id, NotificationCursor.last_read_broadcast_id)
+        .filter(NotificationCursor.user_id == user.id)
+        .first()
+    )
+    if window is None:
+        window = _start_missing_read_cursors([user])[user.id]
+    return tuple(window)
+
+def get_read_cursors(db: Session, users: Sequence[User]) -> Dict[int, int]:
+    """
+    Read cursors of several users in one query; missing ones are started like in get_broadcast_window.
+    """
+    cursors = dict(
+        db.query(NotificationCursor.user_id, NotificationCursor.last_read_broadcast_id)
+        .filter(NotificationCursor.user_id.in_([user.id for user in users]))
+        .all()
+    )
+    missing = [user for user in users if user.id not in cursors]
+    if missing:
+        for user_id, (_, cursor) in _start_missing_read_cursors(missing).items():
+            cursors[user_id] = cursor
+    return cursors
+
+def _start_missing_read_cursors(users: Sequence[User]) -> Dict[int, Tuple[int, int]]:
+    # Own short transaction: this runs on read paths whose session is never committed
+    own_db = SessionLocal()
+    try:
+        start_read_cursors(own_db, users)
+        own_db.commit()
+        windows = (
+            own_db.query(
+                NotificationCursor.user_id, NotificationCursor.joined_broadcast_id,
+                NotificationCursor.last_read_broadcast_id,
+            )
+            .filter(NotificationCursor.user_id.in_([user.id for user in users]))
+            .all()
+        )
+        return {user_id: (joined, cursor) for user_id, joined, cursor in windows}
+    finally:
+        own_db.close()
+
+def advance_read_cursor(db: Session, user_id: int, broadcast_id: int) -> None:
+    """
+    Mark broadcasts up to broadcast_id as read. Never moves the cursor back. Does not commit.
+    """
+    statement = pg_insert(NotificationCursor).values(user_id=user_id, last_read_broadcast_id=broadcast_id)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[NotificationCursor.user_id],
+        set_={
+            "last_read_broadcast_id": func.greatest(
+                NotificationCursor.last_read_broadcast_id, statement.excluded.last_read_broadcast_id
+            ),
+            "updated_at": func.now(),
+        },
+    ))
+
+def latest_broadcast_id(db: Session, user: User) -> int:
+    return db.query(func.max(BroadcastNotification.id)).filter(_visible_to(user)).scalar() or 0
+
+def start_read_cursor(db: Session, user: User) -> None:
+    """
+    New users neither see nor count the broadcasts sent before they joined. Does not commit.
+    """
+    start_read_cursors(db, [user])
+
+def start_read_cursors(db: Session, users: Sequence[User]) -> None:
+    """
+    start_read_cursor for several users: one latest-broadcast query per role, one INSERT. Does not commit.
+    """
+    latest_by_role = {}
+    for user in users:
+        if user.role not in latest_by_role:
+            latest_by_role[user.role] = latest_broadcast_id(db, user)
+    db.execute(
+        pg_insert(NotificationCursor)
+        .values([
+            {"user_id": user.id, "last_read_broadcast_id": latest_by_role[user.role],
+             "joined_broadcast_id": latest_by_role[user.role]}
+            for user in users
+        ])
+        .on_conflict_do_nothing(index_elements=[NotificationCursor.user_id])
+    )
+
+def broadcast_payload(broadcast: BroadcastNotification, user_id: int, cursor: int) -> dict:
+    return {
+        "id": -broadcast.id,
+        "recipient_id": user_id,
+        "message": broadcast.message,
+        "type": broadcast.type,
+        "is_read": broadcast.id <= cursor,
+        "created_at": broadcast.created_at,
+        "kind": "broadcast",
+    }
+
+# Position of a notification in the merged stream (newest first); broadcasts use their negative API id
+Position = Tuple[datetime, int]
+
+def _broadcast_older_than(position: Position, inclusive: bool = False):
+    # (created_at, -id) < position, spelled out so the id comparison can flip sign
+    created_at, api_id = position
+    same_time = -BroadcastNotification.id <= api_id if inclusive else -BroadcastNotification.id < api_id
+    return or_(
+        BroadcastNotification.created_at < created_at,
+        and_(BroadcastNotification.created_at == created_at, same_time),
+    )
+
+def list_notifications(
+    db: Session, user: User, skip: int = 0, limit: int = 100, after: Optional[Position] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Personal notifications and the broadcasts visible to the user, merged newest first by
+    (created_at, id). Pass `after` (a decoded cursor) for keyset paging; `skip` is only used without it.
+    Each source contributes at most skip + limit rows, merged in memory.
+    Returns the page and the cursor of the next one (None on the last page).
+    """
+    window = limit if after else skip + limit
+    joined, cursor = get_broadcast_window(db, user)
+    personal = (
+        db.query(Notification)
+        .filter(Notification.recipient_id == user.id)
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
+    )
+    broadcasts = (
+        db.query(BroadcastNotification)
+        .filter(_visible_to(user, joined))
+        .order_by(BroadcastNotification.created_at.desc(), BroadcastNotification.id.asc())
+    )
+    if after:
+        personal = personal.filter(tuple_(Notification.created_at, Notification.id) < tuple_(*after))
+        broadcasts = broadcasts.filter(_broadcast_older_than(after))
+
+    merged = heapq.merge(
+        (notification_schemas.Notification.model_validate(n).model_dump() for n in personal.limit(window)),
+        (broadcast_payload(b, user.id, cursor) for b in broadcasts.limit(window)),
+        key=lambda n: (n["created_at"], n["id"]),
+        reverse=True,
+    )
+    page = list(merged)[window - limit:window]
+    next_cursor = None
+    if len(page) == limit:
+        next_cursor = encode_cursor(page[-1]["created_at"], page[-1]["id"])
+    return page, next_cursor
+
+def mark_read(
+    db: Session, user: User, ids: Sequence[int] = (), up_to: Optional[Position] = None, everything: bool = False
+) -> Tuple[int, int, int]:
+    """
+    Mark notifications read: personal ones by id, broadcasts by (negative) id, everything at or
+    before the stream position `up_to`, or everything. A broadcast moves the read cursor, so older
+    broadcasts are read too. Does not commit.
+    Returns (personal notifications marked read, broadcasts newly read, broadcast read cursor).
+    """
+    personal_ids = [i for i in ids if i > 0]
+    conditions = []
+    if everything:
+        conditions.append(true())
+    if personal_ids:
+        conditions.append(Notification.id.in_(personal_ids))
+    if up_to:
+        conditions.append(tuple_(Notification.created_at, Notification.id) <= tuple_(*up_to))
+    personal = 0
+    if conditions:
+        personal = db.execute(
+            update(Notification)
+            .where(Notification.recipient_id == user.id, Notification.is_read == False, or_(*conditions))
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+
+    broadcast_ids = [-i for i in ids if i < 0]
+    conditions = []
+    if everything:
+        conditions.append(true())
+    if broadcast_ids:
+        conditions.append(BroadcastNotification.id.in_(broadcast_ids))
+    if up_to:
+        conditions.append(_broadcast_older_than(up_to, inclusive=True))
+    joined, cursor = get_broadcast_window(db, user)
+    newly_read = 0
+    if conditions:
+        target = (
+            db.query(func.max(BroadcastNotification.id))
+            .filter(_visible_to(user, joined), or_(*conditions))
+            .scalar()
+        )
+        if target and target > cursor:
+            newly_read = (
+                db.query(BroadcastNotification)
+                .filter(_visible_to(user, joined), BroadcastNotification.id > cursor, BroadcastNotification.id <= target)
+                .count()
+            )
+            advance_read_cursor(db, user.id, target)
+            cursor = target
+    return personal, newly_read, cursor
@@ -0,0 +1,164 @@
+import asyncio
+import inspect
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Row, delete, func, insert, literal, select, update
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.outbox_event import OutboxDeadLetter, OutboxEvent
+
+# event name -> consumers; a consumer is a sync or async callable taking (event, data)
+Consumer = Callable[[str, Any], Any]
+_consumers: Dict[str, List[Consumer]] = defaultdict(list)
+
+def register_consumer(*events: str):
+    """
+    Decorator: deliver the given events to the decorated function.
+    Delivery is at-least-once, so consumers should tolerate duplicates.
+    """
+    def decorator(consumer: Consumer) -> Consumer:
+        for event in events:
+            _consumers[event].append(consumer)
+        return consumer
+    return decorator
+
+def add_event(db: Session, event: str, data: Any, delay_seconds: float = 0) -> None:
+    """
+    Queue a domain event in the caller's transaction. Does not commit: the event is
+    dispatched only if the change it describes is committed, and not before delay_seconds.
+    """
+    outbox_event = OutboxEvent(event=event, payload=jsonable_encoder(data))
+    if delay_seconds:
+        outbox_event.available_at = func.now() + func.make_interval(0, 0, 0, 0, 0, 0, delay_seconds)
+    db.add(outbox_event)
+
+def claim_events(limit: int) -> List[Row]:
+    """
+    Claim up to `limit` due events (FOR UPDATE SKIP LOCKED, so several dispatchers can run).
+    Claiming bumps attempts and pushes available_at out by the retry delay, which doubles
+    as a lease: events not finished by then are claimed again.
+    """
+    db = SessionLocal()
+    try:
+        due = (
+            select(OutboxEvent.id)
+            .where(OutboxEvent.available_at <= func.now(), OutboxEvent.attempts < settings.OUTBOX_MAX_ATTEMPTS)
+            .order_by(OutboxEvent.available_at, OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        retry_seconds = settings.OUTBOX_RETRY_SECONDS * func.power(2, OutboxEvent.attempts)
+        events = db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(due.scalar_subquery()))
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                available_at=func.now() + func.make_interval(0, 0, 0, 0, 0, 0, retry_seconds),
+            )
+            .returning(OutboxEvent.id, OutboxEvent.event, OutboxEvent.payload, OutboxEvent.attempts)
+            .execution_options(synchronize_session=False)
+        ).all()
+        db.commit()
+        return sorted(events, key=lambda event: event.id)
+    finally:
+        db.close()
+
+_DEAD_LETTER_COLUMNS = ["id", "event", "payload", "attempts", "last_error", "created_at"]
+
+def bury_events(db: Session, event_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    Move events that used up OUTBOX_MAX_ATTEMPTS to outbox_dead_letters, with their last error:
+    the given ones, or all whose last lease has expired (their final attempt never finished).
+    Does not commit. Returns the number of events moved.
+    """
+    exhausted = delete(OutboxEvent).where(OutboxEvent.attempts >= settings.OUTBOX_MAX_ATTEMPTS)
+    if event_ids is not None:
+        exhausted = exhausted.where(OutboxEvent.id.in_(event_ids))
+    else:
+        exhausted = exhausted.where(OutboxEvent.available_at <= func.now())
+    moved = exhausted.returning(*(getattr(OutboxEvent, column) for column in _DEAD_LETTER_COLUMNS)).cte("moved")
+    return db.execute(insert(OutboxDeadLetter).from_select(_DEAD_LETTER_COLUMNS, select(moved))).rowcount
+
+def finish_events(delivered: List[int], failed: Dict[int, str], exhausted: List[int]) -> None:
+    """
+    Delete delivered events; record the error on failed ones (retried once their lease expires)
+    and move the ones out of attempts to the dead letters.
+    """
+    db = SessionLocal()
+    try:
+        if delivered:
+            db.execute(delete(OutboxEvent).where(OutboxEvent.id.in_(delivered)))
+        for event_id, error in failed.items():
+            db.execute(update(OutboxEvent).where(OutboxEvent.id == event_id).values(last_error=error))
+        if exhausted:
+            bury_events(db, exhausted)
+        db.commit()
+    finally:
+        db.close()
+
+def requeue_dead_letters(db: Session, event: Optional[str] = None) -> int:
+    """
+    Put dead letters (all, or one event type) back in the outbox with fresh attempts. Does not commit.
+    """
+    requeued = delete(OutboxDeadLetter)
+    if event is not None:
+        requeued = requeued.where(OutboxDeadLetter.event == event)
+    moved = requeued.returning(
+        OutboxDeadLetter.id, OutboxDeadLetter.event, OutboxDeadLetter.payload, OutboxDeadLetter.last_error,
+        OutboxDeadLetter.created_at,
+    ).cte("requeued")
+    columns = ["id", "event", "payload", "last_error", "created_at", "attempts"]
+    return db.execute(insert(OutboxEvent).from_select(columns, select(moved, literal(0)))).rowcount
+
+def prune_dead_letters(db: Session, days: int) -> int:
+    """
+    Delete dead letters that failed more than `days` ago. Does not commit.
+    """
+    return db.execute(
+        delete(OutboxDeadLetter).where(OutboxDeadLetter.failed_at < func.now() - func.make_interval(0, 0, 0, days))
+    ).rowcount
+
+async def deliver(event: Row) -> None:
+    for consumer in _consumers.get(event.event, []):
+        if inspect.iscoroutinefunction(consumer):
+            await consumer(event.event, event.payload)
+        else:
+            await run_in_threadpool(consumer, event.event, event.payload)
+
+async def dispatch_batch() -> int:
+    """
+    Claim and deliver one batch. Returns the number of events claimed.
+    """
+    events = await run_in_threadpool(claim_events, settings.OUTBOX_BATCH_SIZE)
+    delivered: List[int] = []
+    failed: Dict[int, str] = {}
+    exhausted: List[int] = []
+    for event in events:
+        try:
+            await deliver(event)
+            delivered.append(event.id)
+        except Exception as e:
+            failed[event.id] = f"{type(e).__name__}: {e}"
+            if event.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+                exhausted.append(event.id)
+                print(f"Outbox event {event.id} ({event.event}) gave up after {event.attempts} attempts: {e}")
+    if events:
+        await run_in_threadpool(finish_events, delivered, failed, exhausted)
+    return len(events)
+
+async def run_outbox_dispatcher() -> None:
+    """
+    Lifespan task: drain the outbox in batches, polling every OUTBOX_POLL_SECONDS when it is empty.
+    """
+    while True:
+        try:
+            if await dispatch_batch() == settings.OUTBOX_BATCH_SIZE:
+                continue # more waiting, don't sleep
+        except Exception as e:
+            print(f"Outbox Dispatch Error: {e}")
+        await asyncio.sleep(settings.OUTBOX_POLL_SECONDS)
@@ -0,0 +1,133 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session, joinedload
+
+from app.models.application import Application
+from app.models.cv_text import CVText
+from app.models.job import Job
+from app.models.talent_posting import TalentPosting
+from app.services.ats import get_job_keywords
+from app.utils.text import tokenize
+
+# Standard BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+def query_terms(keywords: Dict[str, float]) -> Dict[str, float]:
+    """
+    Unigram query for BM25 from a job's weighted keyword index.
+    Phrases ("machine learning") contribute each of their words with the phrase weight.
+    """
+    terms: Dict[str, float] = {}
+    for keyword, weight in keywords.items():
+        for token in tokenize(keyword):
+            terms[token] = max(terms.get(token, 0.0), weight)
+    return terms
+
+def load_term_matrix(
+    db: Session, student_ids: Query, terms: Sequence[str]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sparse (COO) student x query-term matrix of term frequencies, restricted to the query
+    vocabulary (the only columns BM25 ever reads), straight from the talent postings.
+    `student_ids` is a query of the students to score.
+    Returns (student_id, col, tf) per non-zero entry.
+    """
+    postings = db.execute(
+        select(TalentPosting.student_id, TalentPosting.term, TalentPosting.tf)
+        .where(TalentPosting.term.in_(terms), TalentPosting.student_id.in_(student_ids.scalar_subquery()))
+    ).all()
+    column = {term: col for col, term in enumerate(terms)}
+    return (
+        np.fromiter((p.student_id for p in postings), dtype=np.int64, count=len(postings)),
+        np.fromiter((column[p.term] for p in postings), dtype=np.int32, count=len(postings)),
+        np.fromiter((p.tf for p in postings), dtype=np.float32, count=len(postings)),
+    )
+
+def bm25_scores(
+    query_weights: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    tf: np.ndarray,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    """
+    BM25 relevance of every document to a weighted query, from the non-zero entries of the
+    document x query-term matrix (COO rows, cols, tf), in a few vectorized passes.
+    """
+    n_docs = len(lengths)
+    if not n_docs or not len(tf):
+        return np.zeros(n_docs, dtype=np.float32)
+
+    avg_length = float(lengths[lengths > 0].mean()) if (lengths > 0).any() else 1.0
+
+    # Document frequency per term -> smoothed, non-negative idf
+    df = np.bincount(cols, minlength=len(query_weights)).astype(np.float32)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+    norm = BM25_K1 * (1.0 - BM25_B + BM25_B * lengths[rows] / avg_length)
+    contributions = query_weights[cols] * idf[cols] * tf * (BM25_K1 + 1.0) / (tf + norm)
+    return np.bincount(rows, weights=contributions, minlength=n_docs).astype(np.float32)
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, without sorting the whole array.
+    """
+    if k <= 0 or not len(scores):
+        return np.empty(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+def rank_applications(db: Session, query: Query, job_id: int, skip: int, limit: int) -> List[Application]:
+    """
+    Page of an (already filtered) Application query for one job, ordered by BM25 relevance of
+    each applicant to the job's keywords. BM25 scores of different jobs' queries are not
+    comparable, so ranking is always within a single job.
+    Only the postings of the query terms are read (talent_postings: CV text, skills and
+    projects); document length is the CV's token count.
+    """
+    applicants = query.filter(Application.job_id == job_id)
+    candidates = (
+        applicants.outerjoin(CVText, CVText.user_id == Application.student_id)
+        .with_entities(Application.id, Application.student_id, CVText.token_count)
+        .all()
+    )
+    if not candidates:
+        return []
+
+    application_ids = np.asarray([c.id for c in candidates], dtype=np.int64)
+    student_ids = np.asarray([c.student_id for c in candidates], dtype=np.int64)
+    lengths = np.asarray([c.token_count or 0 for c in candidates], dtype=np.float32)
+
+    weights_by_term = query_terms(get_job_keywords(db.get(Job, job_id)))
+    scores = np.zeros(len(candidates), dtype=np.float32)
+    if weights_by_term:
+        terms = list(weights_by_term)
+        query_weights = np.asarray([weights_by_term[t] for t in terms], dtype=np.float32)
+        students, cols, tf = load_term_matrix(db, applicants.with_entities(Application.student_id), terms)
+        # Postings are per student: map them to the applicant rows
+        order = np.argsort(student_ids, kind="stable")
+        rows = order[np.searchsorted(student_ids[order], students)]
+        scores = bm25_scores(query_weights, rows, cols, tf, lengths)
+
+    page = top_k(scores, skip + limit)[skip:]
+    if not len(page):
+        return []
+
+    page_ids = application_ids[page].tolist()
+    by_id = {
+        a.id: a for a in db.query(Application)
+        .options(joinedload(Application.student), joinedload(Application.job))
+        .filter(Application.id.in_(page_ids))
+        .all()
+    }
+    ranked = []
+    for application_id, score in zip(page_ids, scores[page].tolist()):
+        application = by_id[application_id]
+        application.relevance = round(score, 4)
+        ranked.append(application)
+    return ranked
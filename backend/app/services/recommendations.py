@@ -0,0 +1,186 @@
+import math
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from app.models.cv_text import CVText, CVTextStatus
+from app.models.job import Job, JobStatus
+from app.models.student_profile import StudentProfile, StudentSkill
+from app.schemas import job as job_schemas
+from app.services.ats import get_job_keywords
+from app.services.ranking import query_terms, top_k
+from app.utils.text import is_keyword, normalize_text, tokenize
+
+# Extra weight of a term listed as a profile skill, by level
+SKILL_LEVEL_WEIGHTS = {"beginner": 1.0, "intermediate": 2.0, "advanced": 3.0}
+STUDENT_VECTOR_CACHE_SIZE = 10_000
+
+TermVector = Dict[str, float]
+
+def _unit(vector: TermVector) -> TermVector:
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {t: w / norm for t, w in vector.items()} if norm else {}
+
+def job_vector(job: Job) -> TermVector:
+    return _unit(query_terms(get_job_keywords(job)))
+
+def build_student_vector(db: Session, student_id: int) -> TermVector:
+    """
+    Unit term vector of a student: log-scaled CV term frequencies plus profile skills.
+    """
+    vector: TermVector = {}
+    cv_text = db.query(CVText).filter(CVText.user_id == student_id).first()
+    if cv_text and cv_text.status == CVTextStatus.READY:
+        for term, count in (cv_text.term_counts or {}).items():
+            if is_keyword(term):
+                vector[term] = 1.0 + math.log(count)
+
+    skills = (
+        db.query(StudentSkill.name, StudentSkill.level)
+        .join(StudentProfile, StudentProfile.id == StudentSkill.profile_id)
+        .filter(StudentProfile.user_id == student_id)
+        .all()
+    )
+    for name, level in skills:
+        for term in tokenize(normalize_text(name)):
+            if is_keyword(term):
+                vector[term] = vector.get(term, 0.0) + SKILL_LEVEL_WEIGHTS.get(level, 1.0)
+
+    return _unit(vector)
+
+class JobVectorIndex:
+    """
+    In-memory sparse matrix (CSR) of open-job vectors plus their serialized payloads.
+    Kept current by create/update hooks, so a recommendation request is one sparse
+    mat-vec and a top-k partial sort without any database access.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._vocabulary: Dict[str, int] = {}
+        self._rows: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._payloads: Dict[int, dict] = {}
+        self._compiled: Optional[tuple] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def load(self, db: Session) -> None:
+        jobs = db.query(Job).filter(Job.status == JobStatus.OPEN).all()
+        with self._lock:
+            self._rows.clear()
+            self._payloads.clear()
+            for job in jobs:
+                self._set_row(job)
+            self._compiled = None
+            self._loaded = True
+
+    def upsert(self, job: Job) -> None:
+        """
+        Add, refresh or drop (when no longer open) a job. Call after commit.
+        """
+        if not self._loaded:
+            return # the first recommendation request loads everything
+        with self._lock:
+            if job.status == JobStatus.OPEN:
+                self._set_row(job)
+            else:
+                self._rows.pop(job.id, None)
+                self._payloads.pop(job.id, None)
+            self._compiled = None
+
+    def remove(self, job_ids: List[int]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                self._rows.pop(job_id, None)
+                self._payloads.pop(job_id, None)
+            self._compiled = None
+
+    def _set_row(self, job: Job) -> None:
+        vector = job_vector(job)
+        cols = np.fromiter(
+            (self._vocabulary.setdefault(t, len(self._vocabulary)) for t in vector),
+            dtype=np.int32, count=len(vector),
+        )
+        weights = np.fromiter(vector.values(), dtype=np.float32, count=len(vector))
+        self._rows[job.id] = (cols, weights)
+        self._payloads[job.id] = jsonable_encoder(job_schemas.Job.model_validate(job))
+
+    def _compile(self) -> tuple:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            job_ids = np.fromiter(self._rows.keys(), dtype=np.int64, count=len(self._rows))
+            rows = list(self._rows.values())
+            lengths = np.asarray([len(cols) for cols, _ in rows], dtype=np.int64)
+            indices = np.concatenate([cols for cols, _ in rows]) if rows else np.empty(0, dtype=np.int32)
+            data = np.concatenate([w for _, w in rows]) if rows else np.empty(0, dtype=np.float32)
+            row_of_nnz = np.repeat(np.arange(len(rows)), lengths)
+            compiled = (job_ids, indices, data, row_of_nnz, dict(self._vocabulary), dict(self._payloads))
+            self._compiled = compiled
+        return compiled
+
+    def recommend(self, student_vector: TermVector, limit: int) -> List[Tuple[dict, float]]:
+        job_ids, indices, data, row_of_nnz, vocabulary, payloads = self._compile()
+        if not len(job_ids):
+            return []
+
+        query = np.zeros(len(vocabulary), dtype=np.float32)
+        for term, weight in student_vector.items():
+            col = vocabulary.get(term)
+            if col is not None:
+                query[col] = weight
+
+        # Cosine similarity of every open job with the student: one sparse mat-vec
+        scores = np.bincount(row_of_nnz, weights=data * query[indices], minlength=len(job_ids))
+        best = top_k(scores, limit)
+        return [(payloads[int(job_ids[i])], round(float(scores[i]), 4)) for i in best]
+
+job_index = JobVectorIndex()
+
+_student_vectors: "OrderedDict[int, TermVector]" = OrderedDict()
+_student_lock = threading.Lock()
+
+def refresh_student_vector(db: Session, student_id: int) -> None:
+    """
+    Recompute a student's vector after a CV upload or profile change.
+    Call after the change is flushed.
+    """
+    vector = build_student_vector(db, student_id)
+    with _student_lock:
+        _student_vectors[student_id] = vector
+        _student_vectors.move_to_end(student_id)
+        while len(_student_vectors) > STUDENT_VECTOR_CACHE_SIZE:
+            _student_vectors.popitem(last=False)
+
+def get_student_vector(db: Session, student_id: int) -> TermVector:
+    with _student_lock:
+        vector = _student_vectors.get(student_id)
+        if vector is not None:
+            _student_vectors.move_to_end(student_id)
+            return vector
+    refresh_student_vector(db, student_id)
+    return _student_vectors.get(student_id, {})
+
+def recommend_jobs(db: Session, student_id: int, limit: int = 20) -> List[dict]:
+    """
+    Open jobs ranked by fit to the student's CV and skills.
+    The database is only touched the first time (index load / student vector build).
+    """
+    if not job_index.loaded:
+        job_index.load(db)
+    vector = get_student_vector(db, student_id)
+    if not vector:
+        return []
+    return [
+        {**payload, "match_score": score}
+        for payload, score in job_index.recommend(vector, limit)
+        if score > 0
+    ]
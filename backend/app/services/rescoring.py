@@ -0,0 +1,132 @@
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, Integer, String, column, func, literal, select, update, values
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.application import Application, ScoreStatus
+from app.models.cv_text import CVText, CVTextStatus
+from app.models.job import Job
+from app.schemas.job import RescoreProgress
+from app.services.ats import count_keyword_hits, get_job_keywords, score_hits
+
+RESCORE_CHUNK_SIZE = 500
+
+# Progress of the latest re-scoring run per job (in-process)
+_progress: Dict[int, RescoreProgress] = {}
+_rerun_requested: set = set()
+_lock = threading.Lock()
+
+def get_rescore_progress(job_id: int) -> Optional[RescoreProgress]:
+    with _lock:
+        progress = _progress.get(job_id)
+        return progress.model_copy() if progress else None
+
+def request_rescore(job_id: int) -> bool:
+    """
+    Queue a re-scoring run for a job.
+    Returns False when a run is already in progress; that run will go over the job once more
+    when it finishes, so the caller must not start another one.
+    """
+    with _lock:
+        current = _progress.get(job_id)
+        if current and current.status in ("queued", "running"):
+            _rerun_requested.add(job_id)
+            return False
+        _progress[job_id] = RescoreProgress(job_id=job_id, status="queued")
+        return True
+
+def _update_progress(job_id: int, **fields) -> None:
+    with _lock:
+        progress = _progress.get(job_id) or RescoreProgress(job_id=job_id, status="queued")
+        _progress[job_id] = progress.model_copy(update=fields)
+
+def _write_scores(db: Session, rows: List[Tuple[int, float, str]]) -> None:
+    # One UPDATE ... FROM (VALUES ...) per chunk instead of one UPDATE per application
+    scores = values(
+        column("id", Integer), column("ats_score", Float), column("ats_status", String),
+        name="scores",
+    ).data(rows)
+    db.execute(
+        update(Application)
+        .where(Application.id == scores.c.id)
+        .values(ats_score=scores.c.ats_score, ats_status=scores.c.ats_status)
+    )
+
+def _rescore_once(db: Session, job_id: int) -> None:
+    job = db.query(Job).filter(Job.id == job_id).first()
+    if not job:
+        _update_progress(job_id, status="failed", error="Job not found", finished_at=datetime.now(timezone.utc))
+        return
+
+    keywords = get_job_keywords(job)
+    # The text is only read to look for phrases; single words come from the term counts
+    text_column = CVText.text if any(" " in keyword for keyword in keywords) else literal("")
+    total = db.query(func.count(Application.id)).filter(Application.job_id == job_id).scalar()
+    _update_progress(job_id, status="running", total=total, processed=0, started_at=datetime.now(timezone.utc))
+    db.commit() # persists the keyword index of legacy jobs, ends the read transaction
+
+    # Keyset-paginated stream over the job's applications with their stored CV text
+    last_id = 0
+    processed = 0
+    while True:
+        chunk = db.execute(
+            select(Application.id, CVText.status, CVText.term_counts, text_column)
+            .outerjoin(CVText, CVText.user_id == Application.student_id)
+            .where(Application.job_id == job_id, Application.id > last_id)
+            .order_by(Application.id)
+            .limit(RESCORE_CHUNK_SIZE)
+        ).all()
+        if not chunk:
+            break
+
+        rows = []
+        for application_id, cv_status, term_counts, cv_text in chunk:
+            if cv_status == CVTextStatus.READY:
+                score = score_hits(keywords, count_keyword_hits(job.id, keywords, cv_text, term_counts or {}))
+                rows.append((application_id, score, ScoreStatus.SCORED.value))
+            elif cv_status == CVTextStatus.FAILED:
+                rows.append((application_id, 0.0, ScoreStatus.FAILED.value))
+            else:
+                rows.append((application_id, 0.0, ScoreStatus.PENDING.value))
+
+        _write_scores(db, rows)
+        db.commit()
+
+        last_id = chunk[-1][0]
+        processed += len(chunk)
+        _update_progress(job_id, processed=processed)
+
+def rescore_job_applications(job_id: int) -> None:
+    """
+    Re-score every application of a job against its current keyword index.
+    Meant to run as a background task after update_job; uses its own session.
+    """
+    db = SessionLocal()
+    start = time.perf_counter()
+    try:
+        while True:
+            _rescore_once(db, job_id)
+            with _lock:
+                rerun = job_id in _rerun_requested
+                _rerun_requested.discard(job_id)
+            if not rerun:
+                break
+            # The job was edited again while we were running
+            print(f"Re-scoring job {job_id} again after a concurrent edit")
+
+        progress = get_rescore_progress(job_id)
+        if progress and progress.status == "running":
+            _update_progress(job_id, status="completed", finished_at=datetime.now(timezone.utc))
+            print(f"Re-scored {progress.processed} applications for job {job_id} in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        db.rollback()
+        print(f"Re-scoring Error for job {job_id}: {e}")
+        with _lock:
+            _rerun_requested.discard(job_id)
+        _update_progress(job_id, status="failed", error=str(e), finished_at=datetime.now(timezone.utc))
+    finally:
+        db.close()
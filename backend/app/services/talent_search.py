@@ -0,0 +1,136 @@
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.cv_text import CVText, CVTextStatus
+from app.models.student_profile import PortfolioProject, StudentProfile, StudentSkill
+from app.models.talent_posting import TalentPosting
+from app.models.user import User, UserRole
+from app.utils.text import is_keyword, normalize_text, tokenize
+
+def _terms(text: str) -> List[str]:
+    return [t for t in tokenize(normalize_text(text or "")) if is_keyword(t)]
+
+def reindex_student(db: Session, student_id: int) -> int:
+    """
+    Replace a student's postings with terms from their CV text, skills and portfolio projects.
+    Does not commit; the caller owns the transaction. Returns the number of distinct terms.
+    """
+    db.flush() # make pending profile/skill/project rows visible to the queries below
+
+    counts: Counter = Counter()
+    cv_text = db.query(CVText).filter(CVText.user_id == student_id).first()
+    if cv_text and cv_text.status == CVTextStatus.READY:
+        counts.update({t: n for t, n in (cv_text.term_counts or {}).items() if is_keyword(t)})
+
+    skills = (
+        db.query(StudentSkill.name)
+        .join(StudentProfile, StudentProfile.id == StudentSkill.profile_id)
+        .filter(StudentProfile.user_id == student_id)
+        .all()
+    )
+    for (name,) in skills:
+        counts.update(_terms(name))
+
+    projects = (
+        db.query(PortfolioProject.title, PortfolioProject.description)
+        .join(StudentProfile, StudentProfile.id == PortfolioProject.profile_id)
+        .filter(StudentProfile.user_id == student_id)
+        .all()
+    )
+    for title, description in projects:
+        counts.update(_terms(f"{title} {description or ''}"))
+
+    db.query(TalentPosting).filter(TalentPosting.student_id == student_id).delete(synchronize_session=False)
+    if counts:
+        db.execute(
+            insert(TalentPosting),
+            [{"term": term, "student_id": student_id, "tf": tf} for term, tf in counts.items()],
+        )
+    return len(counts)
+
+def reindex_all_students(
+    db: Session, chunk_size: int = 200, on_progress: Optional[Callable[[int, int], None]] = None
+) -> int:
+    """
+    Rebuild the whole index (for students who never touched their CV/profile since it existed).
+    Commits every chunk_size students, then calls on_progress(done, total).
+    """
+    student_ids = [sid for (sid,) in db.query(User.id).filter(User.role == UserRole.STUDENT).order_by(User.id)]
+    for i, student_id in enumerate(student_ids, start=1):
+        reindex_student(db, student_id)
+        if i % chunk_size == 0 or i == len(student_ids):
+            db.commit()
+            if on_progress:
+                on_progress(i, len(student_ids))
+    db.commit()
+    return len(student_ids)
+
+def parse_query(q: str) -> List[List[str]]:
+    """
+    Parse "python AND react OR vue" into OR-groups of AND-ed terms:
+    [["python", "react"], ["vue"]]. Plain whitespace means AND, AND binds tighter than OR.
+    """
+    groups: List[List[str]] = [[]]
+    for word in q.split():
+        operator = word.upper()
+        if operator == "OR":
+            groups.append([])
+        elif operator != "AND":
+            groups[-1].extend(_terms(word))
+    return [group for group in groups if group]
+
+def search_students(db: Session, q: str, limit: int = 50) -> List[dict]:
+    """
+    Boolean talent search over the inverted index.
+    Only the posting lists of the query terms are read (one indexed lookup);
+    the AND/OR evaluation and ranking happen on those in memory.
+    """
+    groups = parse_query(q)
+    all_terms = {term for group in groups for term in group}
+    if not all_terms:
+        return []
+
+    postings: Dict[str, Dict[int, int]] = {term: {} for term in all_terms}
+    rows = db.query(TalentPosting.term, TalentPosting.student_id, TalentPosting.tf).filter(
+        TalentPosting.term.in_(all_terms)
+    )
+    for term, student_id, tf in rows:
+        postings[term][student_id] = tf
+
+    scores: Counter = Counter()
+    matched: Dict[int, set] = {}
+    for group in groups:
+        # Intersect starting from the shortest posting list
+        ordered = sorted(set(group), key=lambda t: len(postings[t]))
+        students = set(postings[ordered[0]])
+        for term in ordered[1:]:
+            students &= postings[term].keys()
+            if not students:
+                break
+        for student_id in students:
+            matched.setdefault(student_id, set()).update(group)
+
+    for student_id, terms in matched.items():
+        scores[student_id] = sum(postings[t].get(student_id, 0) for t in terms)
+
+    top = scores.most_common(limit)
+    if not top:
+        return []
+
+    users = {
+        u.id: u for u in db.query(User.id, User.full_name, User.email).filter(User.id.in_([sid for sid, _ in top]))
+    }
+    return [
+        {
+            "student_id": student_id,
+            "full_name": users[student_id].full_name,
+            "email": users[student_id].email,
+            "score": score,
+            "matched_terms": sorted(matched[student_id]),
+        }
+        for student_id, score in top
+        if student_id in users
+    ]
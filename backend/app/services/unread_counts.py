@@ -0,0 +1,169 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.broadcast_notification import BroadcastNotification
+from app.models.notification import Notification
+from app.models.user import User
+from app.services.notifications import get_read_cursors
+
+UNREAD_CACHE_SIZE = 50_000
+
+class UnreadState:
+    """
+    A user's unread personal notifications and broadcast read cursor.
+    Their unread count is `personal` plus the visible broadcasts newer than `cursor`.
+    """
+
+    __slots__ = ("role", "personal", "cursor")
+
+    def __init__(self, role: str, personal: int, cursor: int):
+        self.role = role
+        self.personal = personal
+        self.cursor = cursor
+
+# Per-user states (in-process LRU) and broadcast ids per audience, loaded on first use
+_states: "OrderedDict[int, UnreadState]" = OrderedDict()
+_broadcast_ids: Optional[Dict[Optional[str], List[int]]] = None
+# Bumped by every record_* call: a load that overlapped one is stale and is redone
+_generation = 0
+_lock = threading.Lock()
+LOAD_ATTEMPTS = 3
+
+def _load_broadcast_ids(db: Session) -> Dict[Optional[str], List[int]]:
+    ids: Dict[Optional[str], List[int]] = {}
+    rows = db.query(BroadcastNotification.audience, BroadcastNotification.id).order_by(BroadcastNotification.id)
+    for audience, broadcast_id in rows:
+        ids.setdefault(audience, []).append(broadcast_id)
+    return ids
+
+def _broadcasts_after(broadcast_ids: Dict[Optional[str], List[int]], role: str, cursor: int) -> int:
+    count = 0
+    for audience in (None, role):
+        ids = broadcast_ids.get(audience, [])
+        count += len(ids) - bisect_right(ids, cursor)
+    return count
+
+def _role(user: User) -> str:
+    return getattr(user.role, "value", user.role)
+
+def _load_states(db: Session, users: List[User]) -> Dict[int, UnreadState]:
+    """
+    States of several users in two queries, however many users: grouped unread counts and read cursors.
+    """
+    if not users:
+        return {}
+    # Served by ix_notification_recipient_unread
+    personal = dict(
+        db.query(Notification.recipient_id, func.count())
+        .filter(Notification.recipient_id.in_([user.id for user in users]), Notification.is_read == False)
+        .group_by(Notification.recipient_id)
+        .all()
+    )
+    cursors = get_read_cursors(db, users)
+    return {user.id: UnreadState(_role(user), personal.get(user.id, 0), cursors[user.id]) for user in users}
+
+def _counts(broadcast_ids: Dict[Optional[str], List[int]], states: Dict[int, UnreadState]) -> Dict[int, int]:
+    return {
+        user_id: state.personal + _broadcasts_after(broadcast_ids, state.role, state.cursor)
+        for user_id, state in states.items()
+    }
+
+def _bump() -> None:
+    global _generation
+    _generation += 1
+
+def get_unread_counts(db: Session, users: List[User]) -> Dict[int, int]:
+    """
+    Unread counts of several users from their cached states; the missing ones are loaded in one batch.
+    """
+    global _broadcast_ids
+    for _ in range(LOAD_ATTEMPTS):
+        with _lock:
+            cached: Dict[int, UnreadState] = {}
+            for user in users:
+                state = _states.get(user.id)
+                if state is not None:
+                    _states.move_to_end(user.id)
+                    cached[user.id] = state
+            if len(cached) == len(users) and _broadcast_ids is not None:
+                return _counts(_broadcast_ids, cached)
+            generation = _generation
+            broadcast_ids = _broadcast_ids
+
+        if broadcast_ids is None:
+            broadcast_ids = _load_broadcast_ids(db)
+        loaded = _load_states(db, [user for user in users if user.id not in cached])
+        with _lock:
+            if _generation != generation:
+                continue # a writer committed meanwhile; each query sees the latest commit
+            if _broadcast_ids is None:
+                _broadcast_ids = broadcast_ids
+            for user_id, state in loaded.items():
+                _states[user_id] = state
+                _states.move_to_end(user_id)
+            while len(_states) > UNREAD_CACHE_SIZE:
+                _states.popitem(last=False)
+            return _counts(_broadcast_ids, {**cached, **loaded})
+    # Still racing writers: answer from the database without caching
+    return count_unread(db, users)
+
+def get_unread_count(db: Session, user: User) -> int:
+    return get_unread_counts(db, [user])[user.id]
+
+def count_unread(db: Session, users: List[User]) -> Dict[int, int]:
+    """
+    Unread counts straight from the database, bypassing the cache.
+    """
+    return _counts(_load_broadcast_ids(db), _load_states(db, users))
+
+# Personal counts are dropped rather than adjusted: a load that ran between the commit and
+# the record_* call already saw the change, and adjusting it again would count it twice.
+
+def record_notifications(user_id: int) -> None:
+    """
+    New personal notifications for the user. Call after commit.
+    """
+    with _lock:
+        _bump()
+        _states.pop(user_id, None)
+
+def record_read(user_id: int) -> None:
+    """
+    Personal notifications marked read. Call after commit.
+    """
+    with _lock:
+        _bump()
+        _states.pop(user_id, None)
+
+def record_cursor(user_id: int, cursor: int, all_read: bool = False) -> None:
+    """
+    The user's broadcast cursor moved (and, for read-all, every personal notification was read).
+    Call after commit.
+    """
+    with _lock:
+        _bump()
+        state = _states.get(user_id)
+        if state is None:
+            return
+        if all_read:
+            _states.pop(user_id)
+        else:
+            state.cursor = max(state.cursor, cursor)
+
+def record_broadcast(audience: Optional[str], broadcast_id: int) -> None:
+    """
+    A new broadcast, if broadcast ids are loaded (adding it twice is a no-op). Call after commit.
+    """
+    with _lock:
+        _bump()
+        if _broadcast_ids is None:
+            return
+        ids = _broadcast_ids.setdefault(audience, [])
+        i = bisect_left(ids, broadcast_id)
+        if i == len(ids) or ids[i] != broadcast_id:
+            insort(ids, broadcast_id)
@@ -66,3 +66,22 @@ def send_reset_password_email(email_to: str, email: str, token: str) -> None:
     </html>
     """
     send_email(email_to, subject, html_content)
+
+def send_application_status_email(email_to: str, full_name: Optional[str], job_title: str, status: str) -> None:
+    subject = f"{settings.PROJECT_NAME} - Application Update: {job_title}"
+    link = f"{settings.FRONTEND_URL}/dashboard"
+
+    html_content = f"""
+    <html>
+        <body>
+            <h1>Application Update</h1>
+            <p>Hello {full_name or ""},</p>
+            <p>Your application for <strong>{job_title}</strong> has been updated to: <strong>{status.upper()}</strong>.</p>
+            <p><a href="{link}">View your applications</a></p>
+            <br>
+            <p>Best regards,</p>
+            <p>{settings.EMAILS_FROM_NAME}</p>
+        </body>
+    </html>
+    """
+    send_email(email_to, subject, html_content)
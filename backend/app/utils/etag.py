@@ -0,0 +1,34 @@
+import hashlib
+import uuid
+from typing import Optional
+
+from fastapi import Request, Response
+
+# In-process version counters restart at 0, so ETags built from them also carry the boot id
+BOOT_ID = uuid.uuid4().hex
+
+def make_etag(*parts) -> str:
+    """
+    Strong ETag from cheap change markers (ids, updated_at, counts, version counters).
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def check_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Set the ETag on the response. Returns a bodiless 304 to return as-is when the client
+    already has this version, so the route can skip loading and serializing the payload.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,39 @@
+import re
+import unicodedata
+from typing import List
+
+# Keeps tech tokens like "c++", "c#", "node.js" and "scikit-learn" in one piece
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+# Common English and job-ad filler words that carry no matching signal
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be been before being below between both
+but by can could did do does doing down during each etc experience few for from further good had has
+have having he her here how i if in into is it its itself just knowledge least like more most must
+my nice no nor not of off on once only or other our out over own plus preferred required requirement
+requirements same she should skills so some strong such than that the their them then there these
+they this those through to too under until up very via was we well were what when where which while
+who will with within work working would years you your
+""".split())
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize free text for matching: unicode folding (ligatures, full-width chars),
+    lower-casing and whitespace collapsing.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(text.split())
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split already normalized text into word tokens.
+    """
+    return TOKEN_RE.findall(text)
+
+def is_keyword(token: str) -> bool:
+    """
+    Whether a token is worth indexing/matching: not a stopword, a lone character or a bare number.
+    """
+    return len(token) > 1 and token not in STOPWORDS and not token.replace(".", "").isdigit()
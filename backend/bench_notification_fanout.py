@@ -0,0 +1,75 @@
+"""
+Benchmark: "new job posted" notification fan-out, per-row ORM inserts vs one INSERT ... SELECT
+vs a single broadcast row (what create_job writes now).
+
+Usage: python bench_notification_fanout.py   (uses DATABASE_URL)
+Everything runs inside a transaction that is rolled back, nothing is kept.
+Existing students are hidden for the duration so the counts are exact.
+"""
+import time
+
+from sqlalchemy import false, insert, literal, select, text
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.db.session import engine
+from app.models.broadcast_notification import BroadcastNotification
+from app.models.notification import Notification
+from app.models.user import User, UserRole
+
+STUDENT_COUNTS = [1_000, 10_000, 100_000]
+MESSAGE = "New Job Posted: Benchmark Engineer"
+
+def orm_fan_out(db: Session) -> int:
+    # What create_job used to do inside the request
+    students = db.query(User).filter(User.role == UserRole.STUDENT).all()
+    db.add_all([Notification(recipient_id=student.id, message=MESSAGE, type="info") for student in students])
+    db.flush()
+    return len(students)
+
+def insert_select_fan_out(db: Session) -> int:
+    # One personal notification per student as a single INSERT ... SELECT
+    result = db.execute(
+        insert(Notification).from_select(
+            ["recipient_id", "message", "type", "is_read"],
+            select(User.id, literal(MESSAGE), literal("info"), false()).where(User.role == UserRole.STUDENT),
+        )
+    )
+    return result.rowcount
+
+def broadcast_row(db: Session) -> int:
+    # The row create_broadcast writes; its outbox event is left out so all three time the same work
+    db.add(BroadcastNotification(message=MESSAGE, type="info", audience=UserRole.STUDENT.value))
+    db.flush()
+    return 1
+
+def timed(db: Session, fan_out) -> tuple:
+    savepoint = db.begin_nested()
+    start = time.perf_counter()
+    count = fan_out(db)
+    elapsed = (time.perf_counter() - start) * 1000
+    savepoint.rollback()
+    db.expunge_all()
+    return count, elapsed
+
+def run():
+    with Session(engine) as db:
+        db.execute(text("UPDATE users SET role = 'bench-hidden' WHERE role = 'student'"))
+        print(f"{'students':>8} {'orm add_all (ms)':>17} {'insert-select (ms)':>19} {'broadcast (ms)':>15} {'speedup':>8}")
+        for n in STUDENT_COUNTS:
+            seeded = db.begin_nested()
+            db.execute(text(f"""
+                INSERT INTO users (email, hashed_password, full_name, role, is_active)
+                SELECT 'fanout-' || i || '@example.com', 'x', 'Student ' || i, 'student', true
+                FROM generate_series(1, {n}) i
+            """))
+            orm_count, orm_ms = timed(db, orm_fan_out)
+            sql_count, sql_ms = timed(db, insert_select_fan_out)
+            _, broadcast_ms = timed(db, broadcast_row)
+            assert orm_count == sql_count == n
+            print(f"{n:>8} {orm_ms:>17.0f} {sql_ms:>19.0f} {broadcast_ms:>15.1f} {orm_ms / sql_ms:>7.1f}x")
+            seeded.rollback()
+        db.rollback()
+
+if __name__ == "__main__":
+    run()
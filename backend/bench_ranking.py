@@ -0,0 +1,102 @@
+"""
+Benchmark: BM25 relevance ranking of 10k applicants for one job, over the real request path
+(applicant query, query-term postings, scoring, top-k, page load), next to what loading every
+applicant's CV term_counts blob alone costs (what ranking used to read).
+
+Usage: python bench_ranking.py   (uses DATABASE_URL)
+Seeds synthetic students, CVs, postings and applications inside a transaction that is rolled
+back at the end, nothing is kept.
+"""
+import random
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.db.session import engine
+from app.models.application import Application
+from app.models.cv_text import CVText
+from app.models.job import Job
+from app.services.ranking import rank_applications
+
+APPLICANTS = 10_000
+TOKENS_PER_CV = 900 # ~2 pages
+VOCABULARY = 8_000
+KEYWORDS = [25, 50, 100]
+PAGE = 100
+REPEAT = 5
+
+SEED_SQL = [
+    "INSERT INTO users (email, hashed_password, full_name, role, is_active) "
+    "VALUES ('bench-rank-admin@example.com', 'x', 'Bench Admin', 'admin', true)",
+    f"""
+    INSERT INTO users (email, hashed_password, full_name, role, is_active)
+    SELECT 'bench-rank-' || i || '@example.com', 'x', 'Student ' || i, 'student', true
+    FROM generate_series(1, {APPLICANTS}) i
+    """,
+    # Skewed (log-uniform) word frequencies, like real text
+    f"""
+    INSERT INTO talent_postings (term, student_id, tf)
+    SELECT 'w' || k, student_id, count(*)
+    FROM (
+        SELECT u.id AS student_id, floor(exp(random() * ln({VOCABULARY})))::int AS k
+        FROM users u, generate_series(1, {TOKENS_PER_CV})
+        WHERE u.email LIKE 'bench-rank-%' AND u.role = 'student'
+    ) tokens
+    GROUP BY k, student_id
+    """,
+    f"""
+    INSERT INTO cv_texts (user_id, content_hash, text, term_counts, token_count, status)
+    SELECT student_id, 'bench', '', json_object_agg(term, tf), {TOKENS_PER_CV}, 'ready'
+    FROM talent_postings p JOIN users u ON u.id = p.student_id
+    WHERE u.email LIKE 'bench-rank-%'
+    GROUP BY student_id
+    """,
+    "ANALYZE talent_postings",
+]
+
+def run():
+    random.seed(7)
+    with Session(engine) as db:
+        print(f"Seeding {APPLICANTS} applicants (rolled back afterwards)...")
+        for sql in SEED_SQL:
+            db.execute(text(sql))
+        admin_id = db.execute(text("SELECT id FROM users WHERE email = 'bench-rank-admin@example.com'")).scalar()
+
+        print(f"{'keywords':>8} {'postings':>9} {'ranking (ms)':>13} {'term_counts load (ms)':>22}")
+        for n in KEYWORDS:
+            keywords = {f"w{k}": random.choice([1.0, 1.5, 2.0, 3.0]) for k in random.sample(range(1, 2000), n)}
+            job = Job(title="Bench", description="d", requirements="", admin_id=admin_id, keywords=keywords)
+            db.add(job)
+            db.flush()
+            db.execute(text(
+                "INSERT INTO applications (job_id, student_id, ats_score, status) "
+                "SELECT :job, id, 0, 'applied' FROM users WHERE email LIKE 'bench-rank-%' AND role = 'student'"
+            ), {"job": job.id})
+            db.execute(text("ANALYZE applications"))
+            postings = db.execute(text(
+                "SELECT count(*) FROM talent_postings WHERE term = ANY(:terms)"
+            ), {"terms": list(keywords)}).scalar()
+            query = db.query(Application).join(Job).filter(Job.admin_id == admin_id)
+
+            rank_ms = blob_ms = 0.0
+            for _ in range(REPEAT):
+                db.expunge_all()
+                start = time.perf_counter()
+                rank_applications(db, query, job.id, 0, PAGE)
+                rank_ms += (time.perf_counter() - start) * 1000
+
+                start = time.perf_counter()
+                (
+                    query.filter(Application.job_id == job.id)
+                    .outerjoin(CVText, CVText.user_id == Application.student_id)
+                    .with_entities(Application.id, CVText.term_counts, CVText.token_count)
+                    .all()
+                )
+                blob_ms += (time.perf_counter() - start) * 1000
+            print(f"{n:>8} {postings:>9} {rank_ms / REPEAT:>13.1f} {blob_ms / REPEAT:>22.1f}")
+        db.rollback()
+
+if __name__ == "__main__":
+    run()
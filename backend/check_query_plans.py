@@ -0,0 +1,166 @@
+"""
+Query-plan regression suite for the hot list queries.
+
+Seeds a realistic amount of data inside a transaction (rolled back at the end, nothing is kept),
+runs EXPLAIN on each hot query and fails if a plan uses a sequential scan or an explicit sort.
+Seq scans and sorts are disabled for the planner, so one only shows up when no index can
+serve the query - i.e. an index is missing or a query stopped matching its index.
+
+Usage: python check_query_plans.py   (uses DATABASE_URL, exits 1 on a regression)
+"""
+import json
+import sys
+from datetime import datetime, timezone
+
+from sqlalchemy import func, text, tuple_
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.db.session import engine
+from app.models.application import Application
+from app.models.job import Job, JobStatus
+from app.models.notification import Notification
+
+JOBS = 20_000
+APPLICATIONS = 100_000
+NOTIFICATIONS = 100_000
+ADMINS = 20
+STUDENTS = 5_000
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (email, hashed_password, full_name, role, is_active)
+    SELECT 'plan-admin-' || i || '@example.com', 'x', 'Admin ' || i, 'admin', true
+    FROM generate_series(1, {ADMINS}) i
+    """,
+    f"""
+    INSERT INTO users (email, hashed_password, full_name, role, is_active)
+    SELECT 'plan-student-' || i || '@example.com', 'x', 'Student ' || i, 'student', true
+    FROM generate_series(1, {STUDENTS}) i
+    """,
+    f"""
+    INSERT INTO jobs (title, description, requirements, status, admin_id, created_at)
+    SELECT 'Job ' || i, 'Description ' || i, 'Python SQL',
+           (ARRAY['Open', 'Open', 'Closed', 'Draft'])[1 + i % 4],
+           (SELECT min(id) FROM users WHERE email LIKE 'plan-admin-%') + i % {ADMINS},
+           now() - i * interval '1 minute'
+    FROM generate_series(1, {JOBS}) i
+    """,
+    f"""
+    INSERT INTO applications (job_id, student_id, ats_score, status, created_at)
+    SELECT (SELECT min(j.id) FROM jobs j JOIN users u ON u.id = j.admin_id
+            WHERE u.email LIKE 'plan-admin-%') + i % {JOBS},
+           (SELECT min(id) FROM users WHERE email LIKE 'plan-student-%') + i % {STUDENTS},
+           (i * 37) % 100, 'applied', now() - i * interval '1 second'
+    FROM generate_series(1, {APPLICATIONS}) i
+    """,
+    f"""
+    INSERT INTO notification (recipient_id, message, type, is_read, created_at)
+    SELECT (SELECT min(id) FROM users WHERE email LIKE 'plan-student-%') + i % {STUDENTS},
+           'Notification ' || i, 'info', i % 5 <> 0, now() - i * interval '1 second'
+    FROM generate_series(1, {NOTIFICATIONS}) i
+    """,
+    "ANALYZE users",
+    "ANALYZE jobs",
+    "ANALYZE applications",
+    "ANALYZE notification",
+]
+
+BAD_NODES = {"Seq Scan", "Sort", "Incremental Sort"}
+
+def hot_queries(db: Session, admin_id: int, student_id: int, job_id: int):
+    """
+    (name, query, allowed bad nodes) - mirrors the queries built by the list endpoints.
+    """
+    cursor_position = tuple_(datetime.now(timezone.utc), 1)
+    open_jobs = db.query(Job).filter(Job.status == JobStatus.OPEN)
+    admin_applications = db.query(Application).join(Job).filter(Job.admin_id == admin_id)
+    tsquery = func.websearch_to_tsquery("english", "python")
+    return [
+        ("read_jobs (student, newest)",
+         open_jobs.order_by(Job.created_at.desc(), Job.id.desc()).limit(100), set()),
+        ("read_jobs (student, cursor)",
+         open_jobs.filter(tuple_(Job.created_at, Job.id) < cursor_position)
+         .order_by(Job.created_at.desc(), Job.id.desc()).limit(100), set()),
+        ("read_jobs (student, oldest)",
+         open_jobs.order_by(Job.created_at.asc(), Job.id.asc()).limit(100), set()),
+        # application_status=applied/not_applied filters the cached page with this set
+        ("get_applied_jobs (student's applied set)",
+         db.query(Application.job_id).filter(Application.student_id == student_id), set()),
+        # Ranking needs a sort over the matches; it must still come from the GIN index
+        ("read_jobs (student, q=)",
+         open_jobs.filter(Job.search_vector.op("@@")(tsquery))
+         .order_by(func.ts_rank(Job.search_vector, tsquery).desc(), Job.id.desc()).limit(100), {"Sort"}),
+        ("read_jobs (admin)",
+         db.query(Job).filter(Job.admin_id == admin_id)
+         .order_by(Job.created_at.desc(), Job.id.desc()).limit(100), set()),
+        ("read_jobs (admin, status)",
+         db.query(Job).filter(Job.admin_id == admin_id, Job.status == JobStatus.CLOSED)
+         .order_by(Job.created_at.desc(), Job.id.desc()).limit(100), set()),
+        ("list_applications_admin (all jobs, date_desc)",
+         admin_applications.order_by(Application.created_at.desc()).limit(100), set()),
+        ("list_applications_admin (job, date_desc)",
+         admin_applications.filter(Application.job_id == job_id, Application.status == "applied")
+         .order_by(Application.created_at.desc()).limit(100), set()),
+        ("list_applications_admin (job, score_desc, min_score)",
+         admin_applications.filter(Application.job_id == job_id, Application.ats_score >= 50)
+         .order_by(Application.ats_score.desc()).limit(100), set()),
+        ("list_my_applications",
+         db.query(Application).filter(Application.student_id == student_id), set()),
+        ("read_notifications",
+         db.query(Notification).filter(Notification.recipient_id == student_id)
+         .order_by(Notification.created_at.desc(), Notification.id.desc()).limit(100), set()),
+        ("read_notifications (cursor)",
+         db.query(Notification).filter(
+             Notification.recipient_id == student_id,
+             tuple_(Notification.created_at, Notification.id) < tuple_(func.now(), 0),
+         ).order_by(Notification.created_at.desc(), Notification.id.desc()).limit(100), set()),
+        ("unread notifications",
+         db.query(func.count(Notification.id))
+         .filter(Notification.recipient_id == student_id, Notification.is_read == False), set()),
+    ]
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+def explain(db: Session, query) -> dict:
+    statement = query.statement.compile(engine)
+    result = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", statement.params)
+    return result.scalar()[0]["Plan"]
+
+def run() -> int:
+    failures = 0
+    with Session(engine) as db:
+        print("Seeding plan-check data (rolled back afterwards)...")
+        for sql in SEED_SQL:
+            db.execute(text(sql))
+        admin_id = db.execute(text("SELECT min(id) FROM users WHERE email LIKE 'plan-admin-%'")).scalar()
+        student_id = db.execute(text("SELECT min(id) FROM users WHERE email LIKE 'plan-student-%'")).scalar()
+        job_id = db.execute(text("SELECT min(id) FROM jobs WHERE admin_id = :a"), {"a": admin_id}).scalar()
+
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        db.execute(text("SET LOCAL enable_sort = off"))
+        db.execute(text("SET LOCAL enable_incremental_sort = off"))
+
+        for name, query, allowed in hot_queries(db, admin_id, student_id, job_id):
+            plan = explain(db, query)
+            bad = [
+                f"{node['Node Type']}" + (f" on {node['Relation Name']}" if "Relation Name" in node else "")
+                for node in plan_nodes(plan)
+                if node["Node Type"] in BAD_NODES - allowed
+            ]
+            if bad:
+                failures += 1
+                print(f"FAIL {name}: {', '.join(bad)}")
+                print(json.dumps(plan, indent=2))
+            else:
+                print(f"ok   {name}")
+        db.rollback()
+
+    print(f"{failures} plan regression(s)" if failures else "All hot queries are index-backed.")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,60 @@
+"""
+Notification maintenance: create upcoming monthly partitions, apply the retention policy
+(drop or archive read notifications in months older than NOTIFICATION_RETENTION_DAYS, one
+partition at a time), vacuum and reindex what was compacted, and report table/index bloat before and after.
+
+Usage: python maintain_notifications.py [--days N] [--mode delete|archive] [--dry-run]
+       (uses DATABASE_URL and the NOTIFICATION_* settings; meant to run daily from cron)
+"""
+import argparse
+
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.core.config import settings
+from app.db.session import engine
+from app.services.notification_retention import apply_retention, bloat_report, compact, ensure_partitions
+
+def print_bloat(title: str, rows) -> None:
+    print(f"\n{title}")
+    print(f"{'relation':<52} {'size (kB)':>10} {'live':>9} {'dead':>9} {'bloat %':>8}")
+    for row in rows:
+        live = "" if row["live"] is None else row["live"]
+        dead = "" if row["dead"] is None else row["dead"]
+        bloat = "?" if row["bloat_pct"] is None else row["bloat_pct"]
+        print(f"{row['relation']:<52} {row['bytes'] // 1024:>10} {live:>9} {dead:>9} {bloat:>8}")
+    if any(row["bloat_pct"] is None for row in rows):
+        print("(index bloat needs the pgstattuple extension: CREATE EXTENSION pgstattuple)")
+
+def run(days: int, mode: str, dry_run: bool) -> None:
+    with Session(engine) as db:
+        print_bloat("Before", bloat_report(db))
+
+        if not dry_run:
+            created = ensure_partitions(db)
+            print(f"\nCreated partitions: {', '.join(created) or 'none'}")
+
+        report = apply_retention(db, days=days, mode=mode, dry_run=dry_run)
+        print(f"\nRetention ({mode}, read notifications in months ending before {days} days ago)"
+              f"{' - dry run' if dry_run else ''}:")
+        for entry in report:
+            print(f"  {entry['partition']}: {entry['action']} ({entry['read']} read removed, {entry['unread_kept']} unread kept)")
+        if not report:
+            print("  nothing to do")
+
+    compacted = [entry["partition"] for entry in report if entry["action"] == "compacted" and entry["read"]]
+    if compacted and not dry_run:
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            compact(connection, compacted)
+
+    if not dry_run:
+        with Session(engine) as db:
+            print_bloat("After", bloat_report(db))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS)
+    parser.add_argument("--mode", choices=["delete", "archive"], default=settings.NOTIFICATION_RETENTION_MODE)
+    parser.add_argument("--dry-run", action="store_true", help="report what would be removed, change nothing")
+    args = parser.parse_args()
+    run(args.days, args.mode, args.dry_run)
@@ -0,0 +1,74 @@
+"""
+Outbox maintenance: move events that used up OUTBOX_MAX_ATTEMPTS but were never finished (the
+process died during their last attempt) to the dead letters, report the dead letters per event
+with their latest error, and prune the ones older than OUTBOX_DEAD_LETTER_RETENTION_DAYS.
+Dead letters can be put back in the outbox once the cause is fixed.
+
+Usage: python maintain_outbox.py [--days N] [--requeue [EVENT]] [--dry-run]
+       (uses DATABASE_URL and the OUTBOX_* settings; meant to run daily from cron)
+"""
+import argparse
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.core.config import settings
+from app.db.session import engine
+from app.models.outbox_event import OutboxDeadLetter, OutboxEvent
+from app.services.outbox import bury_events, prune_dead_letters, requeue_dead_letters
+
+def print_dead_letters(db: Session) -> None:
+    rows = (
+        db.query(
+            OutboxDeadLetter.event,
+            func.count(OutboxDeadLetter.id),
+            func.min(OutboxDeadLetter.failed_at),
+            func.max(OutboxDeadLetter.failed_at),
+        )
+        .group_by(OutboxDeadLetter.event)
+        .order_by(OutboxDeadLetter.event)
+        .all()
+    )
+    print(f"\n{'event':<24} {'dead':>6} {'oldest':<20} {'newest':<20} latest error")
+    for event, count, oldest, newest in rows:
+        error = (
+            db.query(OutboxDeadLetter.last_error)
+            .filter(OutboxDeadLetter.event == event)
+            .order_by(OutboxDeadLetter.failed_at.desc())
+            .limit(1)
+            .scalar()
+        )
+        print(f"{event:<24} {count:>6} {oldest:%Y-%m-%d %H:%M:%S}  {newest:%Y-%m-%d %H:%M:%S}  {(error or '')[:80]}")
+    if not rows:
+        print("  no dead letters")
+
+def run(days: int, requeue: Optional[str], dry_run: bool) -> None:
+    with Session(engine) as db:
+        pending = db.query(func.count(OutboxEvent.id)).scalar()
+        print(f"Outbox: {pending} event(s) waiting")
+
+        buried = bury_events(db)
+        print(f"Moved to dead letters (last attempt never finished): {buried}")
+        print_dead_letters(db)
+
+        if requeue is not None:
+            requeued = requeue_dead_letters(db, None if requeue == "all" else requeue)
+            print(f"\nRequeued: {requeued}")
+        pruned = prune_dead_letters(db, days)
+        print(f"Pruned (failed more than {days} days ago): {pruned}{' - dry run' if dry_run else ''}")
+
+        if dry_run:
+            db.rollback()
+        else:
+            db.commit()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--days", type=int, default=settings.OUTBOX_DEAD_LETTER_RETENTION_DAYS)
+    parser.add_argument("--requeue", nargs="?", const="all", metavar="EVENT",
+                        help="put dead letters (all, or one event type) back in the outbox")
+    parser.add_argument("--dry-run", action="store_true", help="report what would change, change nothing")
+    args = parser.parse_args()
+    run(args.days, args.requeue, args.dry_run)
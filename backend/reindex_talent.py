@@ -0,0 +1,32 @@
+"""
+Talent search maintenance: rebuild the postings of every student from their CV text, skills and
+portfolio projects, committing chunk by chunk. The index is otherwise kept up to date on CV upload
+and profile edits; run this once after deploying it, or after changing how terms are extracted.
+
+Usage: python reindex_talent.py [--chunk-size N]   (uses DATABASE_URL)
+"""
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+import app.db.base  # noqa: F401 - registers every mapper
+from app.db.session import engine
+from app.services.talent_search import reindex_all_students
+
+def run(chunk_size: int) -> None:
+    start = time.perf_counter()
+
+    def report(done: int, total: int) -> None:
+        elapsed = time.perf_counter() - start
+        print(f"Reindexed {done}/{total} students ({done / elapsed:.0f}/s)")
+
+    with Session(engine) as db:
+        total = reindex_all_students(db, chunk_size=chunk_size, on_progress=report)
+    print(f"Done: {total} students in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chunk-size", type=int, default=200, help="students per commit")
+    args = parser.parse_args()
+    run(args.chunk_size)
@@ -7,19 +7,37 @@ export interface Notification {
     type: string;
     is_read: boolean;
     created_at: string;
+    kind?: 'personal' | 'broadcast';
 }
 
-export const getNotifications = async (): Promise<Notification[]> => {
-    const response = await api.get('/api/v1/notifications/');
-    return response.data;
+export interface NotificationAckResult {
+    marked_read: number;
+    unread_count: number;
+}
+
+export interface NotificationPage {
+    notifications: Notification[];
+    nextCursor: string | null;
+}
+
+// Newest first; pass the previous page's nextCursor (X-Next-Cursor) to get the next one
+export const getNotifications = async (cursor?: string, limit = 20): Promise<NotificationPage> => {
+    const response = await api.get('/api/v1/notifications/', { params: { cursor, limit } });
+    return { notifications: response.data, nextCursor: response.headers['x-next-cursor'] ?? null };
 };
 
-export const markAsRead = async (id: number): Promise<Notification> => {
-    const response = await api.put(`/api/v1/notifications/${id}/read`);
+export const markAllAsRead = async (): Promise<NotificationAckResult> => {
+    const response = await api.put('/api/v1/notifications/read-all');
     return response.data;
 };
 
-export const markAllAsRead = async (): Promise<Notification[]> => {
-    const response = await api.put('/api/v1/notifications/read-all');
+// Batch ack: ids (broadcasts are negative) and/or everything at or older than a page's X-Next-Cursor
+export const ackNotifications = async (ids: number[], upToCursor?: string): Promise<NotificationAckResult> => {
+    const response = await api.post('/api/v1/notifications/ack', { ids, up_to_cursor: upToCursor });
     return response.data;
 };
+
+export const getUnreadCount = async (): Promise<number> => {
+    const response = await api.get('/api/v1/notifications/unread-count');
+    return response.data.count;
+};
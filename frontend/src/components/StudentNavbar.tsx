@@ -1,7 +1,7 @@
 import { useState, useEffect, useRef } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate, Link } from 'react-router-dom';
-import { getNotifications, markAsRead, markAllAsRead, type Notification } from '../api/notifications';
+import { ackNotifications, getNotifications, getUnreadCount, markAllAsRead, type Notification } from '../api/notifications';
 import { LogOut, User as UserIcon, Briefcase, Bell, X } from 'lucide-react';
 import ThemeToggle from './ThemeToggle';
 import { useWebSocket } from '../context/WebSocketContext';
@@ -19,28 +19,38 @@ const StudentNavbar = ({ onTabChange }: StudentNavbarProps) => {
 
     // Notifications State
     const [notifications, setNotifications] = useState<Notification[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [unreadCount, setUnreadCount] = useState(0);
     const [showNotifications, setShowNotifications] = useState(false);
     const notificationRef = useRef<HTMLDivElement>(null);
 
     // Initial Fetch & WebSocket Listener
     useEffect(() => {
-        if (user) fetchNotifications();
+        if (user) {
+            fetchNotifications();
+            fetchUnreadCount();
+        }
     }, [user]);
 
     useEffect(() => {
         if (!lastEvent) return;
-        // Refresh notifications on relevant events
-        if (lastEvent.event === 'status_updated') {
-            fetchNotifications();
+        // The server pushes the badge count whenever it changes
+        if (lastEvent.event === 'unread_count') {
+            setUnreadCount(lastEvent.data.count);
+            if (showNotifications) fetchNotifications();
         }
     }, [lastEvent]);
 
-    // Poll for notifications (backup)
+    // Poll the badge count (backup); the list is only fetched when needed
     useEffect(() => {
-        const interval = setInterval(fetchNotifications, 30000);
+        const interval = setInterval(fetchUnreadCount, 30000);
         return () => clearInterval(interval);
     }, []);
 
+    useEffect(() => {
+        if (showNotifications) fetchNotifications();
+    }, [showNotifications]);
+
     // Close notifications when clicking outside
     useEffect(() => {
         const handleClickOutside = (event: MouseEvent) => {
@@ -52,19 +62,44 @@ const StudentNavbar = ({ onTabChange }: StudentNavbarProps) => {
         return () => document.removeEventListener("mousedown", handleClickOutside);
     }, []);
 
+    // First page only; older ones are appended with "Load older"
     const fetchNotifications = async () => {
         try {
-            const data = await getNotifications();
-            setNotifications(data);
+            const page = await getNotifications();
+            setNotifications(page.notifications);
+            setNextCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Failed to fetch notifications", error);
+        }
+    };
+
+    const fetchOlderNotifications = async () => {
+        if (!nextCursor) return;
+        try {
+            const page = await getNotifications(nextCursor);
+            setNotifications([...notifications, ...page.notifications]);
+            setNextCursor(page.nextCursor);
         } catch (error) {
             console.error("Failed to fetch notifications", error);
         }
     };
 
+    const fetchUnreadCount = async () => {
+        try {
+            setUnreadCount(await getUnreadCount());
+        } catch (error) {
+            console.error("Failed to fetch unread count", error);
+        }
+    };
+
+    // Reading a broadcast (negative id) also reads every older broadcast
+    const isReadBy = (n: Notification, id: number) => n.id === id || (id < 0 && n.id < 0 && n.id > id);
+
     const handleMarkRead = async (id: number) => {
         try {
-            await markAsRead(id);
-            setNotifications(notifications.map(n => n.id === id ? { ...n, is_read: true } : n));
+            const result = await ackNotifications([id]);
+            setNotifications(notifications.map(n => isReadBy(n, id) ? { ...n, is_read: true } : n));
+            setUnreadCount(result.unread_count);
         } catch (error) {
             console.error(error);
         }
@@ -80,8 +115,6 @@ const StudentNavbar = ({ onTabChange }: StudentNavbarProps) => {
         setIsMenuOpen(false);
     };
 
-    const unreadCount = notifications.filter(n => !n.is_read).length;
-
     return (
         <nav className="bg-white dark:bg-gray-800 shadow-sm border-b border-gray-100 dark:border-gray-700 z-20 sticky top-0 transition-colors duration-200">
             <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
@@ -124,7 +157,7 @@ const StudentNavbar = ({ onTabChange }: StudentNavbarProps) => {
                                             <h3 className="text-sm font-semibold text-gray-700 dark:text-gray-200">Notifications</h3>
                                             {unreadCount > 0 && (
                                                 <button
-                                                    onClick={() => { markAllAsRead(); setNotifications(notifications.map(n => ({ ...n, is_read: true }))); }}
+                                                    onClick={async () => { setNotifications(notifications.map(n => ({ ...n, is_read: true }))); setUnreadCount((await markAllAsRead()).unread_count); }}
                                                     className="text-xs text-indigo-600 hover:text-indigo-800"
                                                 >
                                                     Mark all read
@@ -152,6 +185,14 @@ const StudentNavbar = ({ onTabChange }: StudentNavbarProps) => {
                                                     </div>
                                                 ))
                                             )}
+                                            {nextCursor && (
+                                                <button
+                                                    onClick={fetchOlderNotifications}
+                                                    className="w-full p-3 text-xs text-indigo-600 hover:text-indigo-800 hover:bg-gray-50 dark:hover:bg-gray-700"
+                                                >
+                                                    Load older
+                                                </button>
+                                            )}
                                         </div>
                                     </div>
                                 )}
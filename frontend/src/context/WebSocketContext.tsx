@@ -76,6 +76,11 @@ export const WebSocketProvider: React.FC<{ children: React.ReactNode }> = ({ chi
                             toast.success(`New Job Posted: ${message.data.title}`, { duration: 5000 });
                         }
                         break;
+                    case 'jobs_imported':
+                        if (user?.role === 'student') {
+                            toast.success(`${message.data.count} New Jobs Posted`, { duration: 5000 });
+                        }
+                        break;
                     case 'application_submitted':
                         if (user?.role === 'admin') {
                             toast('New Application Received!', { icon: '📝' });
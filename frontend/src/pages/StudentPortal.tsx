@@ -27,10 +27,14 @@ const StudentPortal = () => {
     useEffect(() => {
         if (!lastEvent) return;
 
-        if (lastEvent.event === 'job_posted') {
+        if (lastEvent.event === 'job_posted' || lastEvent.event === 'jobs_imported') {
             fetchJobs();
             // Optional: show a dot on jobs tab?
             // Optional: show a dot on jobs tab?
+        } else if (lastEvent.event === 'jobs_closed') {
+            // Deadline sweep: drop the closed jobs without refetching
+            const closedIds: number[] = lastEvent.data.job_ids;
+            setJobs(prev => prev.filter(job => !closedIds.includes(job.id)));
         } else if (lastEvent.event === 'status_updated') {
             fetchApplications();
             // Notifications handled in Navbar